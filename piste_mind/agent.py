@@ -1,16 +1,22 @@
 """Common AI agent utilities for piste-mind."""
 
+import functools
 import os
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from enum import Enum
 from pathlib import Path
 from typing import Any, TypeVar
 
-from jinja2 import Template
+import httpx
+import orjson
+from jinja2 import Environment, FunctionLoader, StrictUndefined
 from loguru import logger
 from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.anthropic import AnthropicModel
+from pydantic_ai.providers.anthropic import AnthropicProvider
 
 
 class ModelType(Enum):
@@ -21,9 +27,28 @@ class ModelType(Enum):
     OPUS = "claude-opus-4-20250514"
 
 
+_MODEL_BY_NAME = {model_type.name: model_type for model_type in ModelType}
+
+
+# Requests can run long; concurrent edits want several warm connections
+HTTP_TIMEOUT = httpx.Timeout(600, connect=5)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+@functools.cache
+def _get_http_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by every Anthropic model."""
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+
+@functools.cache
 def get_model(model_type: ModelType) -> AnthropicModel:
     """Get the configured AI model.
 
+    Instances are cached per model type, and all of them send requests
+    through one HTTP client, so concurrent agent calls reuse its keep-alive
+    connection pool instead of opening new TLS sessions.
+
     Args:
         model_type: The model type to use.
 
@@ -31,7 +56,29 @@ def get_model(model_type: ModelType) -> AnthropicModel:
         Configured AnthropicModel instance
     """
     logger.info(f"Initializing AnthropicModel with {model_type.value}")
-    return AnthropicModel(model_type.value)
+    provider = AnthropicProvider(http_client=_get_http_client())
+    return AnthropicModel(model_type.value, provider=provider)
+
+
+# AnthropicModel isn't hashable, so agents are keyed on id(model); the model
+# is stored alongside so its id can't be reused while the entry exists
+_AGENTS: dict[tuple[Hashable, int], tuple[AnthropicModel, Agent]] = {}
+
+
+def cached_agent[T: BaseModel](
+    key: Hashable,
+    model: AnthropicModel,
+    factory: Callable[[AnthropicModel], Agent[T]],
+) -> Agent[T]:
+    """Return the agent for key and model, building it with factory once.
+
+    Agents hold no per-run state, so each module keeps one per model rather
+    than rebuilding it for every request.
+    """
+    entry = _AGENTS.get((key, id(model)))
+    if entry is None:
+        entry = _AGENTS[key, id(model)] = (model, factory(model))
+    return entry[1]  # type: ignore[return-value]
 
 
 def parse_model_type_from_env() -> ModelType:
@@ -44,13 +91,13 @@ def parse_model_type_from_env() -> ModelType:
         ValueError: If PISTE_MIND_MODEL contains invalid model type
     """
     env_model = os.getenv("PISTE_MIND_MODEL", "HAIKU").upper()
-    try:
-        return ModelType[env_model]
-    except KeyError as e:
+    model_type = _MODEL_BY_NAME.get(env_model)
+    if model_type is None:
         err = ValueError(f"Invalid model type in PISTE_MIND_MODEL: '{env_model}'")
-        err.add_note(f"Valid options: {', '.join(m.name for m in ModelType)}")
+        err.add_note(f"Valid options: {', '.join(_MODEL_BY_NAME)}")
         err.add_note("Set PISTE_MIND_MODEL to one of: HAIKU, SONNET, or OPUS")
-        raise err from e
+        raise err
+    return model_type
 
 
 # Configure the default AI model globally
@@ -64,22 +111,20 @@ except ValueError:
 
 MODEL = get_model(_default_model_type)
 
+# Attribute names reported when an agent result is malformed
+MAX_REPORTED_ATTRIBUTES = 20
+
 # Type variable for generic output types
 T = TypeVar("T", bound=BaseModel)
 
 
-def load_prompt_template(template_name: str, **context: Any) -> str:  # noqa: ANN401
-    """Load and render a Jinja2 template from the prompts directory.
+PROMPTS_DIR = Path(__file__).parent / "prompts"
 
-    Args:
-        template_name: Name of the template file (e.g., "scenario.j2")
-        **context: Variables to pass to the template for rendering
 
-    Returns:
-        Rendered prompt string
-    """
-    template_path = Path(__file__).parent / "prompts" / template_name
-    logger.debug(f"Loading template from: {template_path}")
+@functools.cache
+def _load_template_source(template_name: str) -> str:
+    """Read a template from the prompts directory, once per process."""
+    template_path = PROMPTS_DIR / template_name
 
     assert template_path.exists(), (
         f"Template file not found at {template_path}. "
@@ -90,8 +135,7 @@ def load_prompt_template(template_name: str, **context: Any) -> str:  # noqa: AN
         f"Check that '{template_name}' is a regular file, not a directory."
     )
 
-    with template_path.open() as f:
-        template_content = f.read()
+    template_content = template_path.read_text()
 
     assert template_content.strip(), (
         f"Template file {template_path} is empty or contains only whitespace. "
@@ -99,9 +143,74 @@ def load_prompt_template(template_name: str, **context: Any) -> str:  # noqa: AN
     )
 
     logger.debug(f"Template loaded successfully, length: {len(template_content)} chars")
+    return template_content
+
+
+# Compiled templates are cached by name; prompts never change while running.
+# A missing variable is a bug in the caller, so fail instead of rendering "".
+_ENV = Environment(
+    loader=FunctionLoader(_load_template_source),
+    auto_reload=False,
+    cache_size=-1,
+    undefined=StrictUndefined,
+)
+
+
+def _orjson_dumps(
+    obj: object, *, indent: int | None = None, sort_keys: bool = False
+) -> str:
+    """json.dumps stand-in for the tojson filter; orjson only indents by 2."""
+    assert indent in (None, 2), f"orjson can't indent by {indent}, only by 2"
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode()
+
+
+_ENV.policies["json.dumps_function"] = _orjson_dumps
+
+
+# Rendered prompts kept for repeated contexts, e.g. fixtures in dev loops
+PROMPT_CACHE_SIZE = 256
+_RENDERED_PROMPTS: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+
+
+def _context_key(context: dict[str, Any]) -> bytes:
+    """Serialize a render context into a stable cache key."""
+    # str() covers pydantic models and enums; their reprs include every field
+    return orjson.dumps(
+        context,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def load_prompt_template(template_name: str, **context: Any) -> str:  # noqa: ANN401
+    """Load and render a Jinja2 template from the prompts directory.
+
+    Templates are pure functions of their context, so the rendered prompt is
+    cached by template name and serialized context.
+
+    Args:
+        template_name: Name of the template file (e.g., "scenario.j2")
+        **context: Variables to pass to the template for rendering
+
+    Returns:
+        Rendered prompt string
+    """
+    key = (template_name, _context_key(context))
+    cached = _RENDERED_PROMPTS.get(key)
+    if cached is not None:
+        _RENDERED_PROMPTS.move_to_end(key)
+        logger.debug(f"Using cached render of {template_name}")
+        return cached
+
+    logger.debug(f"Loading template {template_name} from: {PROMPTS_DIR}")
+    template = _ENV.get_template(template_name)
 
     logger.debug("Rendering template with provided context")
-    template = Template(template_content)
     rendered_prompt = template.render(**context)
 
     assert rendered_prompt.strip(), (
@@ -113,6 +222,10 @@ def load_prompt_template(template_name: str, **context: Any) -> str:  # noqa: AN
         f"Template rendered with {len(context)} variables, "
         f"final prompt length: {len(rendered_prompt)} chars"
     )
+
+    _RENDERED_PROMPTS[key] = rendered_prompt
+    if len(_RENDERED_PROMPTS) > PROMPT_CACHE_SIZE:
+        _RENDERED_PROMPTS.popitem(last=False)
     return rendered_prompt
 
 
@@ -142,13 +255,17 @@ def _parse_agent_result[T: BaseModel](
         raise err
 
     if not hasattr(result, "output"):
+        # Public attributes only, capped: dir() of a model can run to 80+ entries
+        attributes = [name for name in dir(result) if not name.startswith("_")][
+            :MAX_REPORTED_ATTRIBUTES
+        ]
         logger.error(f"AI agent result missing 'output' attribute for {operation_name}")
-        logger.error(f"Result type: {type(result)}, attributes: {dir(result)}")
+        logger.error(f"Result type: {type(result)}, attributes: {attributes}")
         err = AttributeError(
             f"AI agent result missing 'output' attribute for {operation_name}"
         )
         err.add_note(f"Got result type: {type(result)}")
-        err.add_note(f"Result attributes: {dir(result)}")
+        err.add_note(f"Result attributes: {attributes}")
         raise err
 
     if not isinstance(result.output, expected_type):
@@ -187,7 +304,7 @@ async def run_agent(
     logger.debug(f"Estimated prompt tokens: ~{estimated_tokens}")
 
     # Log the full prompt at debug level
-    logger.debug(f"Full prompt for {operation_name}:\n{prompt}")
+    logger.debug("Full prompt for {}:\n{}", operation_name, prompt)
 
     logger.debug("Getting AI to generate response")
     logger.info(f"Sending prompt to AI agent for {operation_name}")
@@ -202,18 +319,12 @@ async def run_agent(
     logger.debug("Validating and extracting agent output")
     output = _parse_agent_result(result, expected_type, operation_name)
 
-    # Log the response content
-    logger.debug(
-        f"Response from AI for {operation_name}:\n{output.model_dump_json(indent=2)}"
+    # Log the response content, serialising it only if a sink wants DEBUG
+    logger.opt(lazy=True).debug(
+        "Response from AI for {}:\n{}",
+        lambda: operation_name,
+        lambda: output.model_dump_json(indent=2),
     )
 
     logger.success(f"AI agent completed {operation_name} successfully")
-
-    logger.debug("Logging output details")
-    for field_name, field_value in output.__dict__.items():
-        if isinstance(field_value, str):
-            logger.debug(f"{field_name} length: {len(field_value)} chars")
-        elif isinstance(field_value, list):
-            logger.debug(f"{field_name} count: {len(field_value)} items")
-
     return output
@@ -0,0 +1,20 @@
+"""Tests for the shared agent cache."""
+
+from piste_mind.agent import ModelType, cached_agent, get_model
+
+
+def test_cached_agent_builds_once_per_key_and_model() -> None:
+    """The factory runs once for each (key, model) pair."""
+    built = []
+
+    def factory(model):
+        built.append(model)
+        return object()
+
+    haiku, sonnet = get_model(ModelType.HAIKU), get_model(ModelType.SONNET)
+
+    first = cached_agent("test", haiku, factory)
+    assert cached_agent("test", haiku, factory) is first
+    assert cached_agent("test", sonnet, factory) is not first
+    assert cached_agent("other test", haiku, factory) is not first
+    assert built == [haiku, sonnet, haiku]
@@ -4,12 +4,12 @@ from loguru import logger
 from pydantic_ai import Agent
 from pydantic_ai.models.anthropic import AnthropicModel
 
-from piste_mind.agent import MODEL, load_prompt_template, run_agent
-from piste_mind.models import Choices, Scenario
+from piste_mind.agent import MODEL, cached_agent, load_prompt_template, run_agent
+from piste_mind.models import OPTION_LETTERS, Choices, Scenario
 
 
-def create_options_agent(model: AnthropicModel = MODEL) -> Agent[Choices]:
-    """Create agent for generating strategic options."""
+def _new_options_agent(model: AnthropicModel) -> Agent[Choices]:
+    """Build the strategic options agent for model."""
     logger.info("Creating options agent with temperature=0.5")
     agent = Agent(
         model=model,
@@ -22,6 +22,11 @@ def create_options_agent(model: AnthropicModel = MODEL) -> Agent[Choices]:
     return agent  # type: ignore[return-value]
 
 
+def create_options_agent(model: AnthropicModel = MODEL) -> Agent[Choices]:
+    """Create agent for generating strategic options, reused per model."""
+    return cached_agent("options", model, _new_options_agent)
+
+
 async def generate_options(
     scenario: Scenario, model: AnthropicModel = MODEL
 ) -> Choices:
@@ -54,12 +59,12 @@ if __name__ == "__main__":
         choices: Choices = await generate_options(scenario)
         print(f"\n{'=' * 80}\nSCENARIO:\n{scenario.scenario}\n\nOPTIONS:")
         for i, option in enumerate(choices.options):
-            print(f"\n{chr(65 + i)}. {option}")
-        print(f"\nRECOMMENDED: Option {chr(65 + choices.recommend)}")
+            print(f"\n{OPTION_LETTERS[i]}. {option}")
+        print(f"\nRECOMMENDED: Option {OPTION_LETTERS[choices.recommend]}")
         print("=" * 80)
 
         logger.debug("Saving scenario and options separately")
-        scenario_path = save_session(scenario, SessionType.CHOICES)
+        scenario_path = await save_session(scenario, SessionType.CHOICES)
         print(f"\nScenario saved to: {scenario_path}")
         # Note: Options are part of the interaction flow but not saved separately
 
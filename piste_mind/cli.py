@@ -1,13 +1,16 @@
 """Command-line interface for piste-mind."""
 
 import asyncio
+from collections.abc import Callable
 
 import click
 from loguru import logger
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.styles import Style
-from rich.console import Console
+from pydantic import BaseModel
+from pydantic_ai.models.anthropic import AnthropicModel
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.rule import Rule
 
@@ -15,13 +18,34 @@ from piste_mind.agent import ModelType, get_model
 from piste_mind.choices import generate_options
 from piste_mind.editor import edit_content
 from piste_mind.feedback import generate_feedback
-from piste_mind.models import Answer, AnswerChoice, Challenge
+from piste_mind.models import OPTION_LETTERS, Answer, AnswerChoice, Challenge
 from piste_mind.scenario import generate_scenario
 from piste_mind.session import SessionType, save_session
 
 console = Console()
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return libuv's event loop factory when uvloop is installed."""
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:  # Optional: install the "fast" extra to enable
+        return None
+    return uvloop.new_event_loop
+
+
+_VALID_CHOICES = {choice.name: choice for choice in AnswerChoice}
+_MODEL_BY_CLI = {model_type.name.lower(): model_type for model_type in ModelType}
+
+# (Feedback field, panel title, border style) in display order
+_FEEDBACK_PANELS = (
+    ("acknowledgment", "[green]✓ Acknowledgment[/green]", "green"),
+    ("analysis", "[blue]🔍 Tactical Analysis[/blue]", "blue"),
+    ("advanced_concepts", "[magenta]📚 Advanced Concepts[/magenta]", "magenta"),
+    ("bridge_to_mastery", "[yellow]🏆 Bridge to Mastery[/yellow]", "yellow"),
+)
+
+
 def parse_answer_choice(text: str) -> AnswerChoice:
     """Parse user input into an AnswerChoice.
 
@@ -29,12 +53,13 @@ def parse_answer_choice(text: str) -> AnswerChoice:
         ValueError: If input is not a valid choice (A, B, C, or D)
     """
     normalized = text.strip().upper()
-    if normalized not in ["A", "B", "C", "D"]:
+    choice = _VALID_CHOICES.get(normalized)
+    if choice is None:
         err = ValueError(f"Invalid answer choice: '{text}'")
         err.add_note("Expected one of: A, B, C, or D (case insensitive)")
         err.add_note(f"Received: '{text}' (normalized to: '{normalized}')")
         raise err
-    return AnswerChoice[normalized]
+    return choice
 
 
 async def get_user_choice(session: PromptSession) -> AnswerChoice:
@@ -48,10 +73,24 @@ async def get_user_choice(session: PromptSession) -> AnswerChoice:
             console.print("[yellow]Please enter A, B, C, or D[/yellow]")
 
 
+async def maybe_edit[T: BaseModel](
+    content: T, model: AnthropicModel, *, edit: bool | None
+) -> T:
+    """Run content through the editor as --edit/--no-edit asks.
+
+    edit=True always edits and edit=False never does; with edit=None the
+    editor's own gate skips short or already readable text.
+    """
+    if edit is False:
+        logger.debug(f"Skipping editor for {type(content).__name__}")
+        return content
+    return await edit_content(content, model, force=edit is True)
+
+
 @click.command()
 @click.option(
     "--model",
-    type=click.Choice(["haiku", "sonnet", "opus"], case_sensitive=False),
+    type=click.Choice(list(_MODEL_BY_CLI), case_sensitive=False),
     default="haiku",
     help="AI model to use (default: haiku)",
 )
@@ -61,12 +100,18 @@ async def get_user_choice(session: PromptSession) -> AnswerChoice:
     is_flag=True,
     help="Save question and feedback to files",
 )
-def train(model: str, save: bool) -> None:  # noqa: FBT001
+@click.option(
+    "--edit/--no-edit",
+    default=None,
+    help="Always or never rewrite scenario and feedback for readability "
+    "(default: only long text that reads below plain English)",
+)
+def train(model: str, save: bool, edit: bool | None) -> None:  # noqa: FBT001
     """Interactive tactical training session for epee fencers."""
 
     async def run_session() -> None:
         logger.debug("Configuring AI model")
-        model_type = ModelType[model.upper()]
+        model_type = _MODEL_BY_CLI[model]
         selected_model = get_model(model_type)
 
         logger.debug("Step 1: Generating scenario and options")
@@ -78,7 +123,7 @@ def train(model: str, save: bool) -> None:  # noqa: FBT001
 
         logger.debug("Creating challenge and editing for readability")
         challenge = Challenge(scenario=scenario, choices=options)
-        edited_challenge = await edit_content(challenge, selected_model)
+        edited_challenge = await maybe_edit(challenge, selected_model, edit=edit)
 
         # Display the edited scenario
         console.print(
@@ -129,7 +174,7 @@ def train(model: str, save: bool) -> None:  # noqa: FBT001
         feedback = await generate_feedback(scenario, options, user_answer)
 
         logger.debug("Editing feedback for better readability")
-        edited_feedback = await edit_content(feedback, selected_model)
+        edited_feedback = await maybe_edit(feedback, selected_model, edit=edit)
 
         # Display feedback with rich formatting
         console.print(
@@ -138,54 +183,35 @@ def train(model: str, save: bool) -> None:  # noqa: FBT001
 
         # Display the recommended option (using edited version for display)
         console.print(
-            f"\n[bold green]Coach's Recommended Option:[/bold green] {chr(65 + options.recommend)}"
+            f"\n[bold green]Coach's Recommended Option:[/bold green] {OPTION_LETTERS[options.recommend]}"
         )
         console.print(
             f"[dim]{edited_challenge.choices.options[options.recommend]}[/dim]\n"
         )
 
+        # Render all feedback panels in one pass and one write to the terminal
         console.print(
-            Panel(
-                edited_feedback.acknowledgment,
-                title="[green]✓ Acknowledgment[/green]",
-                border_style="green",
-                padding=(1, 2),
-            )
-        )
-
-        console.print(
-            Panel(
-                edited_feedback.analysis,
-                title="[blue]🔍 Tactical Analysis[/blue]",
-                border_style="blue",
-                padding=(1, 2),
-            )
-        )
-
-        console.print(
-            Panel(
-                edited_feedback.advanced_concepts,
-                title="[magenta]📚 Advanced Concepts[/magenta]",
-                border_style="magenta",
-                padding=(1, 2),
-            )
-        )
-
-        console.print(
-            Panel(
-                edited_feedback.bridge_to_mastery,
-                title="[yellow]🏆 Bridge to Mastery[/yellow]",
-                border_style="yellow",
-                padding=(1, 2),
+            Group(
+                *(
+                    Panel(
+                        getattr(edited_feedback, field_name),
+                        title=title,
+                        border_style=border_style,
+                        padding=(1, 2),
+                    )
+                    for field_name, title, border_style in _FEEDBACK_PANELS
+                )
             )
         )
 
         # Save if requested
         if save:
             logger.debug("Saving each component separately")
-            save_session(scenario, SessionType.QUESTION)
-            save_session(user_answer, SessionType.ANSWER)
-            feedback_path = save_session(feedback, SessionType.FEEDBACK)
+            _, _, feedback_path = await asyncio.gather(
+                save_session(scenario, SessionType.QUESTION),
+                save_session(user_answer, SessionType.ANSWER),
+                save_session(feedback, SessionType.FEEDBACK),
+            )
 
             console.print(
                 f"\n[green]✅ Session saved to {feedback_path.parent / feedback_path.stem.rsplit('_', 1)[0]}_*[/green]"
@@ -193,8 +219,8 @@ def train(model: str, save: bool) -> None:  # noqa: FBT001
 
         console.print("\n[bold cyan]🎯 Training session complete![/bold cyan]\n")
 
-    # Run the async session
-    asyncio.run(run_session())
+    # Run the async session, on libuv's event loop when it is installed
+    asyncio.run(run_session(), loop_factory=_loop_factory())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+"""Tests for the CLI's --edit/--no-edit handling."""
+
+import pytest
+
+from piste_mind import cli
+from piste_mind.agent import MODEL
+from piste_mind.fixtures import scenario_fixture
+
+
+@pytest.mark.parametrize(
+    ("edit", "force"), [(True, True), (None, False)], ids=["edit", "default"]
+)
+async def test_maybe_edit_forces_the_editor_only_for_edit(
+    monkeypatch: pytest.MonkeyPatch, edit: bool | None, force: bool
+) -> None:
+    """--edit overrides the editor's gate; the default leaves it to decide."""
+    calls = []
+
+    async def edit_content(content, model, *, force):
+        calls.append(force)
+        return content
+
+    monkeypatch.setattr(cli, "edit_content", edit_content)
+
+    await cli.maybe_edit(scenario_fixture(), MODEL, edit=edit)
+
+    assert calls == [force]
+
+
+async def test_no_edit_skips_the_editor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """--no-edit never calls the editor."""
+
+    async def edit_content(content, model, *, force):
+        raise AssertionError("--no-edit must not edit")
+
+    monkeypatch.setattr(cli, "edit_content", edit_content)
+
+    scenario = scenario_fixture()
+    assert await cli.maybe_edit(scenario, MODEL, edit=False) is scenario
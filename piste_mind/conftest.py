@@ -0,0 +1,33 @@
+"""Shared pytest configuration for the colocated unit tests."""
+
+import os
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from piste_mind.db.connection import close_async_connection, get_database_path
+
+# The model client needs a key at import, but tests never call the API
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_database(tmp_path_factory: pytest.TempPathFactory) -> Generator[None]:
+    """Point the database at a throwaway file that pytest cleans up.
+
+    The path is resolved lazily and then cached, so this runs before any
+    test opens a connection.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "sessions.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("PISTE_MIND_DB_PATH", str(db_path))
+        get_database_path.cache_clear()
+        yield
+    get_database_path.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+async def _close_async_pool() -> AsyncGenerator[None]:
+    """Close pooled connections so none outlive the test's event loop."""
+    yield
+    await close_async_connection()
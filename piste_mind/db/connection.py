@@ -1,17 +1,26 @@
 """Database connection and schema management."""
 
+import asyncio
+import atexit
+import functools
 import os
 import sqlite3
+import threading
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import aiosqlite
 from loguru import logger
 
 
+@functools.lru_cache(maxsize=1)
 def get_database_path() -> str:
-    """Get the database file path from environment or default."""
+    """Get the database file path from environment or default.
+
+    Resolved once per process; the directory is created on the first call.
+    """
     db_path = os.getenv("PISTE_MIND_DB_PATH", "~/.piste-mind/sessions.db")
     db_path = Path(db_path).expanduser()
 
@@ -21,102 +30,337 @@ def get_database_path() -> str:
     return str(db_path)
 
 
-def create_schema(conn: sqlite3.Connection) -> None:
-    """Create database schema if it doesn't exist."""
-    conn.execute("PRAGMA foreign_keys = ON")
-
-    # Sessions table - main session tracking
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS sessions (
-            session_id TEXT PRIMARY KEY,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            state TEXT NOT NULL DEFAULT 'created',
-            interface TEXT NOT NULL,
-            model_used TEXT NOT NULL DEFAULT 'haiku',
-            user_id TEXT,
-            
-            -- Serialized JSON fields for complex data
-            scenario TEXT,          -- JSON
-            choices TEXT,           -- JSON
-            user_answer TEXT,       -- JSON
-            feedback TEXT,          -- JSON
-            
-            -- Analytics
-            time_to_choice REAL,
-            time_to_explanation REAL,
-            total_session_time REAL,
-            
-            -- Error tracking
-            error_message TEXT,
-            error_count INTEGER DEFAULT 0
-        )
-    """)
-
-    # Session events table - detailed event tracking
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS session_events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT NOT NULL,
-            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            event_type TEXT NOT NULL,  -- 'state_change', 'error', 'user_action'
-            event_data TEXT,           -- JSON with event details
-            FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-        )
-    """)
-
-    # Indexes for performance
-    conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at)"
+# WAL is persisted in the database file; synchronous is per connection and
+# is set alongside foreign_keys whenever a connection is opened.
+_SCHEMA_SQL = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_mode = WAL;
+
+    -- Sessions table - main session tracking
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at INTEGER NOT NULL,  -- UTC epoch microseconds
+        updated_at INTEGER NOT NULL,  -- UTC epoch microseconds
+        state TEXT NOT NULL DEFAULT 'created',
+        interface TEXT NOT NULL,
+        model_used TEXT NOT NULL DEFAULT 'haiku',
+        user_id TEXT,
+
+        -- Serialized JSON fields for complex data. Write them with
+        -- model_dump_json() and read them with TypeAdapter(Model).validate_json();
+        -- don't round-trip through stdlib json.
+        scenario TEXT,          -- JSON
+        choices TEXT,           -- JSON
+        user_answer TEXT,       -- JSON
+        feedback TEXT,          -- JSON
+
+        -- Scalars copied out of the JSON fields on write so listings and
+        -- analytics never need to parse them
+        user_choice INTEGER,        -- user_answer.choice
+        recommended_choice INTEGER, -- choices.recommend
+        choice_correct INTEGER,     -- 1/0 once both are known
+
+        -- Analytics
+        time_to_choice REAL,
+        time_to_explanation REAL,
+        total_session_time REAL,
+
+        -- Error tracking
+        error_message TEXT,
+        error_count INTEGER DEFAULT 0
+    );
+
+    -- Session events table - detailed event tracking
+    CREATE TABLE IF NOT EXISTS session_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        event_type TEXT NOT NULL,  -- 'state_change', 'error', 'user_action'
+        event_data TEXT,           -- JSON with event details
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+    );
+
+    -- Indexes for performance. list_sessions pages newest first on
+    -- (created_at, session_id), so each filter it offers has an index in that
+    -- order and a page is one range scan with no sort, however deep it is.
+    -- They replace the single-column indexes of earlier versions.
+    DROP INDEX IF EXISTS idx_sessions_created_at;
+    DROP INDEX IF EXISTS idx_sessions_state;
+    DROP INDEX IF EXISTS idx_sessions_user_id;
+    CREATE INDEX IF NOT EXISTS idx_sessions_created
+        ON sessions(created_at DESC, session_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_sessions_state_created
+        ON sessions(state, created_at DESC, session_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_sessions_user_created
+        ON sessions(user_id, created_at DESC, session_id DESC);
+    -- Also serves filters on both user and state, such as the
+    -- completed-session accuracy count
+    CREATE INDEX IF NOT EXISTS idx_sessions_user_state_created
+        ON sessions(user_id, state, created_at DESC, session_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_sessions_state_updated
+        ON sessions(state, updated_at);
+    CREATE INDEX IF NOT EXISTS idx_session_events_session_id ON session_events(session_id);
+"""
+
+_CONNECTION_PRAGMAS = ("PRAGMA foreign_keys = ON", "PRAGMA synchronous = NORMAL")
+
+
+# Columns added after the first release, backfilled from the JSON fields
+_ADDED_SESSION_COLUMNS = {
+    "user_choice": "INTEGER",
+    "recommended_choice": "INTEGER",
+    "choice_correct": "INTEGER",
+}
+
+_BACKFILL_CHOICE_COLUMNS_SQL = """
+    UPDATE sessions SET
+        user_choice = json_extract(user_answer, '$.choice'),
+        recommended_choice = json_extract(choices, '$.recommend'),
+        choice_correct = json_extract(user_answer, '$.choice')
+            = json_extract(choices, '$.recommend')
+"""
+
+
+def _migrate_session_columns(conn: sqlite3.Connection) -> None:
+    """Add columns missing from databases created by older versions."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+    missing = {
+        name: sql_type
+        for name, sql_type in _ADDED_SESSION_COLUMNS.items()
+        if name not in existing
+    }
+    if not missing:
+        return
+
+    logger.info(f"Adding session columns: {', '.join(missing)}")
+    alters = "".join(
+        f"ALTER TABLE sessions ADD COLUMN {name} {sql_type};"
+        for name, sql_type in missing.items()
     )
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_state ON sessions(state)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)")
-    conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_session_events_session_id ON session_events(session_id)"
+    conn.executescript(f"BEGIN; {alters} {_BACKFILL_CHOICE_COLUMNS_SQL}; COMMIT;")
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Convert an aware datetime to the stored UTC epoch microseconds."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Convert stored UTC epoch microseconds back to an aware datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _text_to_epoch_us(value: str) -> int:
+    """Parse an ISO 8601 timestamp written by older versions."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        # CURRENT_TIMESTAMP defaults were naive UTC
+        parsed = parsed.replace(tzinfo=UTC)
+    return to_epoch_us(parsed)
+
+
+def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+    """Convert ISO 8601 session timestamps to epoch microseconds."""
+    rows = conn.execute(
+        """
+        SELECT session_id, created_at, updated_at FROM sessions
+        WHERE typeof(created_at) = 'text' OR typeof(updated_at) = 'text'
+        """
+    ).fetchall()
+    if not rows:
+        return
+
+    logger.info(f"Converting timestamps of {len(rows)} sessions to epoch microseconds")
+    conn.execute("BEGIN")
+    conn.executemany(
+        "UPDATE sessions SET created_at = ?, updated_at = ? WHERE session_id = ?",
+        [
+            (
+                _text_to_epoch_us(str(created_at)),
+                _text_to_epoch_us(str(updated_at)),
+                session_id,
+            )
+            for session_id, created_at, updated_at in rows
+        ],
     )
+    conn.execute("COMMIT")
 
-    conn.commit()
+
+# Upgrades for databases written by older versions, in order. PRAGMA
+# user_version records how many have run, so each runs once per database;
+# both are idempotent in case the process stops before the version is saved.
+_MIGRATIONS = (_migrate_session_columns, _migrate_text_timestamps)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Run the migrations this database hasn't had yet."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for number, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {number}")
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """Create database schema if it doesn't exist."""
+    # executescript commits any pending transaction and runs the DDL in one call
+    conn.executescript(_SCHEMA_SQL)
+    _migrate(conn)
     logger.info("Database schema created/verified")
 
 
+# Schema creation is deferred until the first connection is requested
+_schema_ready = threading.Event()
+_schema_lock = threading.Lock()
+
+# Sync connections are opened once per thread and reused until exit
+_thread_local = threading.local()
+_open_connections: list[sqlite3.Connection] = []
+_open_connections_lock = threading.Lock()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a sync connection with the standard row factory and pragmas."""
+    # Autocommit mode; closed from the atexit hook, possibly on another thread
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _get_thread_connection() -> sqlite3.Connection:
+    """Return this thread's sync connection, opening it on first use."""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        db_path = get_database_path()
+        logger.debug(f"Opening database connection to {db_path}")
+        conn = _connect(db_path)
+        _thread_local.conn = conn
+        with _open_connections_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+@atexit.register
+def close_connections() -> None:
+    """Close every cached sync connection."""
+    with _open_connections_lock:
+        for conn in _open_connections:
+            conn.close()
+        _open_connections.clear()
+
+
+def ensure_schema() -> None:
+    """Initialize the database the first time it is used in this process."""
+    if _schema_ready.is_set():
+        return
+
+    with _schema_lock:
+        if not _schema_ready.is_set():
+            initialize_database()
+            _schema_ready.set()
+
+
 @contextmanager
 def get_connection() -> Generator[sqlite3.Connection]:
-    """Get a database connection (sync)."""
-    db_path = get_database_path()
-    logger.debug(f"Opening database connection to {db_path}")
+    """Get this thread's shared database connection (sync)."""
+    ensure_schema()
+    yield _get_thread_connection()
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
 
-    # Enable foreign keys
-    conn.execute("PRAGMA foreign_keys = ON")
+# Physical connections kept open for async callers; WAL lets readers overlap
+ASYNC_POOL_SIZE = 8
 
-    try:
-        yield conn
-    finally:
-        conn.close()
+_ASYNC_CONNECTION_PRAGMAS = (
+    *_CONNECTION_PRAGMAS,
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache, allocated as used
+)
+
+
+class _AsyncConnectionPool:
+    """Lazily opened aiosqlite connections reused across the process.
+
+    aiosqlite runs each connection on its own thread, so reconnecting per
+    query pays thread start-up and a cold page cache on every call. Each
+    caller gets a connection to itself for the duration of its block, which
+    keeps its statements and commit together.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self.connections: list[aiosqlite.Connection] = []
+        self.reserved = 0
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open one physical connection with the pool's pragmas applied."""
+        db_path = get_database_path()
+        logger.debug(f"Opening async database connection to {db_path}")
+
+        conn = aiosqlite.connect(db_path)
+        # Don't let the worker thread keep the interpreter alive at exit
+        conn.daemon = True
+        await conn
+        conn.row_factory = aiosqlite.Row
+        for pragma in _ASYNC_CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        self.connections.append(conn)
+        return conn
+
+    async def acquire(self) -> aiosqlite.Connection:
+        """Take an idle connection, opening a new one while below size."""
+        if self.idle.empty() and self.reserved < self.size:
+            self.reserved += 1
+            try:
+                return await self._open()
+            except BaseException:
+                self.reserved -= 1
+                raise
+        return await self.idle.get()
+
+    async def release(self, conn: aiosqlite.Connection) -> None:
+        """Return a connection, discarding any transaction left open."""
+        if conn.in_transaction:
+            await conn.rollback()
+        self.idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every connection the pool has opened."""
+        for conn in self.connections:
+            await conn.close()
+        self.connections.clear()
+        self.idle = asyncio.Queue()
+        self.reserved = 0
+
+
+_async_pool = _AsyncConnectionPool(ASYNC_POOL_SIZE)
 
 
 @asynccontextmanager
 async def get_async_connection() -> AsyncGenerator[aiosqlite.Connection]:
-    """Get an async database connection."""
-    db_path = get_database_path()
-    logger.debug(f"Opening async database connection to {db_path}")
+    """Get a pooled async database connection."""
+    ensure_schema()
 
-    async with aiosqlite.connect(db_path) as conn:
-        conn.row_factory = aiosqlite.Row
-        await conn.execute("PRAGMA foreign_keys = ON")
+    conn = await _async_pool.acquire()
+    try:
         yield conn
+    finally:
+        await _async_pool.release(conn)
 
 
-def initialize_database() -> None:
-    """Initialize the database with schema."""
-    db_path = get_database_path()
-    logger.info(f"Initializing database at {db_path}")
-
-    with get_connection() as conn:
-        create_schema(conn)
+async def close_async_connection() -> None:
+    """Close the pooled async connections, e.g. on application shutdown."""
+    await _async_pool.close()
 
 
-# Initialize database on module import
-initialize_database()
+def initialize_database() -> None:
+    """Initialize the database with schema."""
+    logger.info(f"Initializing database at {get_database_path()}")
+    create_schema(_get_thread_connection())
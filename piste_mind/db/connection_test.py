@@ -0,0 +1,201 @@
+"""Tests for upgrading databases written by older versions."""
+
+import sqlite3
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from piste_mind.db.connection import SCHEMA_VERSION, create_schema, from_epoch_us
+from piste_mind.fixtures import answer_fixture, choices_fixture
+from piste_mind.models import AnswerChoice
+
+# The sessions table as the first release created it: no choice columns and
+# ISO 8601 text timestamps
+_LEGACY_SESSIONS_SQL = """
+    CREATE TABLE sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        state TEXT NOT NULL DEFAULT 'created',
+        interface TEXT NOT NULL,
+        model_used TEXT NOT NULL DEFAULT 'haiku',
+        user_id TEXT,
+        scenario TEXT,
+        choices TEXT,
+        user_answer TEXT,
+        feedback TEXT,
+        time_to_choice REAL,
+        time_to_explanation REAL,
+        total_session_time REAL,
+        error_message TEXT,
+        error_count INTEGER DEFAULT 0
+    )
+"""
+
+
+@pytest.fixture
+def legacy_db(tmp_path: Path) -> Generator[sqlite3.Connection]:
+    """A connection to a database in the first release's format."""
+    conn = sqlite3.connect(tmp_path / "legacy.db", isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute(_LEGACY_SESSIONS_SQL)
+    yield conn
+    conn.close()
+
+
+def _insert_legacy(
+    conn: sqlite3.Connection,
+    session_id: str,
+    *,
+    timestamps: tuple[str, str] = (
+        "2024-05-01T12:30:45+00:00",
+        "2024-05-01T12:30:45+00:00",
+    ),
+    answer: str | None = None,
+    choices: str | None = None,
+) -> None:
+    conn.execute(
+        """
+        INSERT INTO sessions (
+            session_id, created_at, updated_at, interface, user_answer, choices
+        ) VALUES (?, ?, ?, 'cli', ?, ?)
+        """,
+        (session_id, *timestamps, answer, choices),
+    )
+
+
+def _row(conn: sqlite3.Connection, session_id: str) -> sqlite3.Row:
+    return conn.execute(
+        "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
+    ).fetchone()
+
+
+def test_choice_columns_are_added_and_backfilled(
+    legacy_db: sqlite3.Connection,
+) -> None:
+    """Old rows get the choice scalars extracted from their JSON fields."""
+    choices = choices_fixture().model_dump_json()
+    wrong = answer_fixture().model_copy(update={"choice": AnswerChoice.C})
+    _insert_legacy(
+        legacy_db,
+        "correct",
+        answer=answer_fixture().model_dump_json(),
+        choices=choices,
+    )
+    _insert_legacy(legacy_db, "wrong", answer=wrong.model_dump_json(), choices=choices)
+    _insert_legacy(legacy_db, "unanswered", choices=choices)
+
+    create_schema(legacy_db)
+
+    correct = _row(legacy_db, "correct")
+    assert correct["user_choice"] == AnswerChoice.A
+    assert correct["recommended_choice"] == choices_fixture().recommend
+    assert correct["choice_correct"] == 1
+
+    assert _row(legacy_db, "wrong")["user_choice"] == AnswerChoice.C
+    assert _row(legacy_db, "wrong")["choice_correct"] == 0
+
+    unanswered = _row(legacy_db, "unanswered")
+    assert unanswered["user_choice"] is None
+    assert unanswered["recommended_choice"] == choices_fixture().recommend
+    assert unanswered["choice_correct"] is None
+
+
+def test_text_timestamps_become_epoch_microseconds(
+    legacy_db: sqlite3.Connection,
+) -> None:
+    """ISO text timestamps, aware or naive UTC, convert to the same instant."""
+    _insert_legacy(
+        legacy_db,
+        "aware",
+        timestamps=("2024-05-01T12:30:45.123456+00:00", "2024-05-01T14:30:45+02:00"),
+    )
+    # CURRENT_TIMESTAMP defaults were written naive, in UTC
+    _insert_legacy(
+        legacy_db, "naive", timestamps=("2024-05-01 12:30:45", "2024-05-01 12:31:00")
+    )
+
+    create_schema(legacy_db)
+
+    aware = _row(legacy_db, "aware")
+    assert from_epoch_us(aware["created_at"]) == datetime(
+        2024, 5, 1, 12, 30, 45, 123456, tzinfo=UTC
+    )
+    assert from_epoch_us(aware["updated_at"]) == datetime(
+        2024, 5, 1, 12, 30, 45, tzinfo=UTC
+    )
+
+    naive = _row(legacy_db, "naive")
+    assert from_epoch_us(naive["created_at"]) == datetime(
+        2024, 5, 1, 12, 30, 45, tzinfo=UTC
+    )
+    assert from_epoch_us(naive["updated_at"]) == datetime(
+        2024, 5, 1, 12, 31, tzinfo=UTC
+    )
+    types = legacy_db.execute(
+        "SELECT DISTINCT typeof(created_at), typeof(updated_at) FROM sessions"
+    ).fetchall()
+    assert [tuple(row) for row in types] == [("integer", "integer")]
+
+
+def test_upgraded_schema_is_left_alone_on_the_next_start(
+    legacy_db: sqlite3.Connection,
+) -> None:
+    """Running the migrations again changes nothing."""
+    _insert_legacy(
+        legacy_db,
+        "session",
+        answer=answer_fixture().model_dump_json(),
+        choices=choices_fixture().model_dump_json(),
+    )
+    create_schema(legacy_db)
+    before = dict(_row(legacy_db, "session"))
+
+    create_schema(legacy_db)
+
+    assert dict(_row(legacy_db, "session")) == before
+
+
+@pytest.mark.parametrize(
+    ("where", "params"),
+    [
+        ("", ()),
+        ("user_id = ? AND", ("user",)),
+        ("state = ? AND", ("completed",)),
+        ("user_id = ? AND state = ? AND", ("user", "completed")),
+    ],
+    ids=["all", "user", "state", "user and state"],
+)
+def test_session_pages_are_read_in_index_order(
+    legacy_db: sqlite3.Connection, where: str, params: tuple[str, ...]
+) -> None:
+    """Each list_sessions filter pages through an index without sorting."""
+    create_schema(legacy_db)
+
+    plan = legacy_db.execute(
+        f"""
+        EXPLAIN QUERY PLAN
+        SELECT session_id, created_at, state FROM sessions
+        WHERE {where} (created_at, session_id) < (?, ?)
+        ORDER BY created_at DESC, session_id DESC LIMIT ?
+        """,
+        (*params, 0, "", 50),
+    ).fetchall()
+
+    details = [row["detail"] for row in plan]
+    assert any(detail.startswith("SEARCH") for detail in details), details
+    assert not any("TEMP B-TREE" in detail for detail in details), details
+
+
+def test_migrations_run_once_per_database(legacy_db: sqlite3.Connection) -> None:
+    """Once user_version is current, startup skips the migrations."""
+    create_schema(legacy_db)
+    assert legacy_db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    # Only a migration would convert this, so it must survive the next start
+    _insert_legacy(legacy_db, "late")
+    create_schema(legacy_db)
+
+    assert isinstance(_row(legacy_db, "late")["created_at"], str)
@@ -2,7 +2,6 @@
 
 from datetime import UTC, datetime
 from enum import Enum
-from typing import ClassVar
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -50,14 +49,6 @@ class TrainingSession(BaseModel):
     error_message: str | None = None
     error_count: int = 0
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders: ClassVar[dict] = {
-            datetime: lambda v: v.isoformat(),
-            Enum: lambda v: v.value,
-        }
-
 
 class SessionSummary(BaseModel):
     """Lightweight session summary for analytics."""
@@ -72,6 +63,14 @@ class SessionSummary(BaseModel):
     total_time: float | None = None
 
 
+class SessionPage(BaseModel):
+    """One page of session summaries, newest first."""
+
+    sessions: list[SessionSummary]
+    # (created_at, session_id) of the last summary; None on the final page
+    next_cursor: tuple[datetime, str] | None = None
+
+
 class UserPerformance(BaseModel):
     """Aggregate performance metrics for a user."""
 
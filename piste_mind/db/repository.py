@@ -1,22 +1,159 @@
 """Repository pattern implementation for session data access."""
 
-from datetime import UTC, datetime
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Iterable, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
+import aiosqlite
 from loguru import logger
+from pydantic import BaseModel, TypeAdapter
 
-from piste_mind.db.connection import get_async_connection
+from piste_mind.db.connection import (
+    from_epoch_us,
+    get_async_connection,
+    to_epoch_us,
+)
 from piste_mind.db.models import (
     SessionAnalytics,
+    SessionPage,
     SessionState,
     SessionSummary,
     TrainingSession,
     UserPerformance,
 )
-from piste_mind.models import Answer, Choices, Feedback, Scenario
+from piste_mind.models import Answer, AnswerChoice, Choices, Feedback, Scenario
+
+# Built once at import so reads go straight to the compiled validators
+_SCENARIO_TA = TypeAdapter(Scenario)
+_CHOICES_TA = TypeAdapter(Choices)
+_ANSWER_TA = TypeAdapter(Answer)
+_FEEDBACK_TA = TypeAdapter(Feedback)
+
+
+# Plain dict lookups instead of Enum construction for every row
+_STATE_FROM_STR = {state.value: state for state in SessionState}
+_STATE_TO_STR = {state: state.value for state in SessionState}
+
+# Sessions in any other state are still in progress and may time out
+_FINISHED_STATES = {SessionState.COMPLETED, SessionState.ABANDONED, SessionState.ERROR}
+_IN_PROGRESS_STATES = ", ".join(
+    f"'{state.value}'" for state in SessionState if state not in _FINISHED_STATES
+)
+
+# Built once so every cleanup reuses the same cached statement. Comparing
+# updated_at with a precomputed cutoff and listing the in-progress states
+# positively (rather than NOT IN) lets it use idx_sessions_state_updated.
+_ABANDON_STALE_SQL = f"""
+    UPDATE sessions
+    SET state = 'abandoned', error_message = 'Session timed out'
+    WHERE state IN ({_IN_PROGRESS_STATES}) AND updated_at < ?
+"""
+
+# TrainingSession fields update_session can write, in column order
+UPDATABLE_FIELDS = (
+    "state",
+    "scenario",
+    "choices",
+    "user_answer",
+    "feedback",
+    "time_to_choice",
+    "time_to_explanation",
+    "total_session_time",
+    "error_message",
+    "error_count",
+)
+
+# The scalar choice columns are derived from these fields
+_CHOICE_SOURCE_FIELDS = frozenset({"choices", "user_answer"})
+_CHOICE_COLUMNS = ("user_choice", "recommended_choice", "choice_correct")
+
+# Recently read or written sessions kept per repository instance
+SESSION_CACHE_SIZE = 128
+
+
+def _private_copy(session: TrainingSession) -> TrainingSession:
+    """Copy a session so neither the cache nor the caller sees the other's edits.
+
+    Scenario, Choices and Feedback are frozen, so they are shared; only the
+    mutable Answer gets a copy of its own.
+    """
+    answer = session.user_answer
+    return session.model_copy(
+        update={"user_answer": answer.model_copy() if answer is not None else None}
+    )
 
 
 class SessionRepository:
-    """Data access layer for session management."""
+    """Data access layer for session management.
+
+    Sessions this process has just written or read are served from a small
+    LRU cache, written through on every create and update. The cache assumes
+    this process is the only writer, as it is for the CLI and the web app.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = SESSION_CACHE_SIZE,
+        *,
+        cache: OrderedDict[str, TrainingSession] | None = None,
+        connection: aiosqlite.Connection | None = None,
+    ) -> None:
+        """Initialize with a session cache, empty unless one is shared.
+
+        connection is only passed for the repository yielded by transaction().
+        """
+        self._cache = OrderedDict() if cache is None else cache
+        self._cache_size = cache_size
+        self._conn = connection
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncGenerator[aiosqlite.Connection]:
+        """Use the bound transaction's connection, or borrow a pooled one."""
+        if self._conn is not None:
+            yield self._conn
+            return
+
+        async with get_async_connection() as conn:
+            yield conn
+
+    async def _commit(self, conn: aiosqlite.Connection) -> None:
+        """Commit, unless the write belongs to an enclosing transaction."""
+        if self._conn is None:
+            await conn.commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator["SessionRepository"]:
+        """Run several repository calls on one connection with one commit.
+
+        Yields a repository bound to a single pooled connection; its writes
+        are committed together when the block exits and rolled back if it
+        raises. The bound repository shares this one's session cache.
+        """
+        if self._conn is not None:
+            yield self
+            return
+
+        async with get_async_connection() as conn:
+            bound = SessionRepository(
+                self._cache_size, cache=self._cache, connection=conn
+            )
+            try:
+                yield bound
+            except BaseException:
+                await conn.rollback()
+                # Cached copies may hold writes that were just discarded
+                self._cache.clear()
+                raise
+            await conn.commit()
+
+    def _remember(self, session: TrainingSession) -> None:
+        """Cache a private copy of a session, evicting the least recent."""
+        self._cache[session.session_id] = _private_copy(session)
+        self._cache.move_to_end(session.session_id)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
     @staticmethod
     def _serialize_model(model: object | None) -> str | None:
@@ -31,77 +168,90 @@ class SessionRepository:
         """Deserialize JSON to Scenario model."""
         if data is None:
             return None
-        return Scenario.model_validate_json(data)
+        return _SCENARIO_TA.validate_json(data)
 
     @staticmethod
     def _deserialize_choices(data: str | None) -> Choices | None:
         """Deserialize JSON to Choices model."""
         if data is None:
             return None
-        return Choices.model_validate_json(data)
+        return _CHOICES_TA.validate_json(data)
 
     @staticmethod
     def _deserialize_answer(data: str | None) -> Answer | None:
         """Deserialize JSON to Answer model."""
         if data is None:
             return None
-        return Answer.model_validate_json(data)
+        return _ANSWER_TA.validate_json(data)
 
     @staticmethod
     def _deserialize_feedback(data: str | None) -> Feedback | None:
         """Deserialize JSON to Feedback model."""
         if data is None:
             return None
-        return Feedback.model_validate_json(data)
-
-    def _row_to_summary(self, data: dict) -> SessionSummary:
-        """Convert database row to SessionSummary."""
-        # Extract user choice from answer if available
-        user_choice = None
-        if data["user_answer"]:
-            answer = self._deserialize_answer(data["user_answer"])
-            user_choice = answer.choice if answer else None
-
-        # Extract recommended choice from choices if available
-        recommended_choice = None
+        return _FEEDBACK_TA.validate_json(data)
+
+    @staticmethod
+    def _choice_columns(
+        session: TrainingSession,
+    ) -> tuple[int | None, int | None, int | None]:
+        """Extract the scalar choice columns stored alongside the JSON fields."""
+        user_choice = session.user_answer.choice.value if session.user_answer else None
+        recommended_choice = session.choices.recommend if session.choices else None
         choice_correct = None
-        if data["choices"]:
-            choices = self._deserialize_choices(data["choices"])
-            if choices:
-                recommended_choice = choices.recommend
-                if user_choice is not None:
-                    choice_correct = user_choice.value == recommended_choice
-
-        return SessionSummary(
-            session_id=data["session_id"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            state=SessionState(data["state"]),
-            interface=data["interface"],
-            user_choice=user_choice,
+        if user_choice is not None and recommended_choice is not None:
+            choice_correct = int(user_choice == recommended_choice)
+        return user_choice, recommended_choice, choice_correct
+
+    @staticmethod
+    def _row_to_summary(row: Sequence[Any]) -> SessionSummary:
+        """Convert a projected summary row to SessionSummary.
+
+        Rows come from our own writes, so validation is skipped; the enum and
+        datetime conversions it would have done are applied here.
+        """
+        (
+            session_id,
+            created_at,
+            state,
+            interface,
+            user_choice,
+            recommended_choice,
+            choice_correct,
+            total_time,
+        ) = row
+
+        return SessionSummary.model_construct(
+            session_id=session_id,
+            created_at=from_epoch_us(created_at),
+            state=_STATE_FROM_STR[state],
+            interface=interface,
+            user_choice=AnswerChoice(user_choice) if user_choice is not None else None,
             recommended_choice=recommended_choice,
-            choice_correct=choice_correct,
-            total_time=data["total_session_time"],
+            choice_correct=bool(choice_correct) if choice_correct is not None else None,
+            total_time=total_time,
         )
 
     async def create_session(self, session: TrainingSession) -> TrainingSession:
         """Create a new session."""
         logger.debug(f"Creating session {session.session_id}")
 
-        async with get_async_connection() as conn:
+        async with self._connection() as conn:
             await conn.execute(
                 """
                 INSERT INTO sessions (
                     session_id, created_at, updated_at, state, interface,
                     model_used, user_id, scenario, choices, user_answer,
-                    feedback, time_to_choice, time_to_explanation,
+                    feedback, user_choice, recommended_choice, choice_correct,
+                    time_to_choice, time_to_explanation,
                     total_session_time, error_message, error_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     session.session_id,
-                    session.created_at.isoformat(),
-                    session.updated_at.isoformat(),
-                    session.state.value,
+                    to_epoch_us(session.created_at),
+                    to_epoch_us(session.updated_at),
+                    _STATE_TO_STR[session.state],
                     session.interface,
                     session.model_used,
                     session.user_id,
@@ -109,6 +259,7 @@ class SessionRepository:
                     self._serialize_model(session.choices),
                     self._serialize_model(session.user_answer),
                     self._serialize_model(session.feedback),
+                    *self._choice_columns(session),
                     session.time_to_choice,
                     session.time_to_explanation,
                     session.total_session_time,
@@ -116,8 +267,9 @@ class SessionRepository:
                     session.error_count,
                 ),
             )
-            await conn.commit()
+            await self._commit(conn)
 
+        self._remember(session)
         logger.info(f"Session {session.session_id} created successfully")
         return session
 
@@ -125,7 +277,13 @@ class SessionRepository:
         """Retrieve session by ID."""
         logger.debug(f"Retrieving session {session_id}")
 
-        async with get_async_connection() as conn:
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            self._cache.move_to_end(session_id)
+            # Callers mutate what they get back, so never hand out the cached one
+            return _private_copy(cached)
+
+        async with self._connection() as conn:
             cursor = await conn.execute(
                 "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
             )
@@ -135,65 +293,75 @@ class SessionRepository:
             logger.warning(f"Session {session_id} not found")
             return None
 
-        # Convert row to dict
-        data = dict(row)
-
-        # Deserialize complex fields
-        session = TrainingSession(
-            session_id=data["session_id"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            state=SessionState(data["state"]),
-            interface=data["interface"],
-            model_used=data["model_used"],
-            user_id=data["user_id"],
-            scenario=self._deserialize_scenario(data["scenario"]),
-            choices=self._deserialize_choices(data["choices"]),
-            user_answer=self._deserialize_answer(data["user_answer"]),
-            feedback=self._deserialize_feedback(data["feedback"]),
-            time_to_choice=data["time_to_choice"],
-            time_to_explanation=data["time_to_explanation"],
-            total_session_time=data["total_session_time"],
-            error_message=data["error_message"],
-            error_count=data["error_count"],
+        # The row is our own write, so skip revalidating the top-level fields;
+        # model_construct won't coerce, hence the explicit conversions
+        session = TrainingSession.model_construct(
+            session_id=row["session_id"],
+            created_at=from_epoch_us(row["created_at"]),
+            updated_at=from_epoch_us(row["updated_at"]),
+            state=_STATE_FROM_STR[row["state"]],
+            interface=row["interface"],
+            model_used=row["model_used"],
+            user_id=row["user_id"],
+            scenario=self._deserialize_scenario(row["scenario"]),
+            choices=self._deserialize_choices(row["choices"]),
+            user_answer=self._deserialize_answer(row["user_answer"]),
+            feedback=self._deserialize_feedback(row["feedback"]),
+            time_to_choice=row["time_to_choice"],
+            time_to_explanation=row["time_to_explanation"],
+            total_session_time=row["total_session_time"],
+            error_message=row["error_message"],
+            error_count=row["error_count"],
         )
 
+        self._remember(session)
         logger.debug(f"Session {session_id} retrieved successfully")
         return session
 
-    async def update_session(self, session: TrainingSession) -> TrainingSession:
-        """Update existing session."""
+    def _column_value(self, session: TrainingSession, field: str) -> object:
+        """Return the stored form of one TrainingSession field."""
+        value = getattr(session, field)
+        if isinstance(value, BaseModel):
+            return self._serialize_model(value)
+        if isinstance(value, SessionState):
+            return _STATE_TO_STR[value]
+        return value
+
+    async def update_session(
+        self, session: TrainingSession, fields: Iterable[str] | None = None
+    ) -> TrainingSession:
+        """Update existing session.
+
+        Pass the fields a state transition changed to write only their
+        columns (plus updated_at); otherwise every updatable column is
+        rewritten, including all four JSON fields.
+        """
         logger.debug(f"Updating session {session.session_id}")
 
+        changed = frozenset(UPDATABLE_FIELDS if fields is None else fields)
+        unknown = changed.difference(UPDATABLE_FIELDS)
+        assert not unknown, f"Not updatable: {', '.join(sorted(unknown))}"
+
         session.updated_at = datetime.now(UTC)
 
-        async with get_async_connection() as conn:
+        values = {"updated_at": to_epoch_us(session.updated_at)}
+        values |= {
+            field: self._column_value(session, field)
+            for field in UPDATABLE_FIELDS
+            if field in changed
+        }
+        if changed & _CHOICE_SOURCE_FIELDS:
+            values |= zip(_CHOICE_COLUMNS, self._choice_columns(session), strict=True)
+
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        async with self._connection() as conn:
             await conn.execute(
-                """
-                UPDATE sessions SET
-                    updated_at = ?, state = ?, scenario = ?, choices = ?,
-                    user_answer = ?, feedback = ?, time_to_choice = ?,
-                    time_to_explanation = ?, total_session_time = ?,
-                    error_message = ?, error_count = ?
-                WHERE session_id = ?
-                """,
-                (
-                    session.updated_at.isoformat(),
-                    session.state.value,
-                    self._serialize_model(session.scenario),
-                    self._serialize_model(session.choices),
-                    self._serialize_model(session.user_answer),
-                    self._serialize_model(session.feedback),
-                    session.time_to_choice,
-                    session.time_to_explanation,
-                    session.total_session_time,
-                    session.error_message,
-                    session.error_count,
-                    session.session_id,
-                ),
+                f"UPDATE sessions SET {assignments} WHERE session_id = ?",
+                (*values.values(), session.session_id),
             )
-            await conn.commit()
+            await self._commit(conn)
 
+        self._remember(session)
         logger.info(f"Session {session.session_id} updated successfully")
         return session
 
@@ -202,12 +370,27 @@ class SessionRepository:
         user_id: str | None = None,
         state: SessionState | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[SessionSummary]:
-        """List sessions with filtering."""
+        after: tuple[datetime, str] | None = None,
+    ) -> SessionPage:
+        """List sessions with filtering.
+
+        Pages are keyed on (created_at, session_id) rather than an offset.
+        Every combination of the user and state filters has an index in that
+        order, so a page is one index range scan with no sort, however deep
+        it is. Pass the previous page's next_cursor as after to continue.
+
+        This replaced the offset parameter and the list[SessionSummary]
+        return value: callers read page.sessions, and instead of
+        offset=n * limit they pass the cursor of the page before.
+        """
         logger.debug("Listing sessions with filters")
 
-        query = "SELECT * FROM sessions WHERE 1=1"
+        query = """
+            SELECT
+                session_id, created_at, state, interface, user_choice,
+                recommended_choice, choice_correct, total_session_time
+            FROM sessions WHERE 1=1
+        """
         params = []
 
         if user_id is not None:
@@ -216,28 +399,35 @@ class SessionRepository:
 
         if state is not None:
             query += " AND state = ?"
-            params.append(state.value)
+            params.append(_STATE_TO_STR[state])
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        if after is not None:
+            created_at, session_id = after
+            query += " AND (created_at, session_id) < (?, ?)"
+            params.extend([to_epoch_us(created_at), session_id])
 
-        async with get_async_connection() as conn:
+        query += " ORDER BY created_at DESC, session_id DESC LIMIT ?"
+        params.append(limit)
+
+        async with self._connection() as conn:
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
 
-        summaries = []
-        for row in rows:
-            summary = self._row_to_summary(dict(row))
-            summaries.append(summary)
+        summaries = [self._row_to_summary(row) for row in rows]
+
+        next_cursor = None
+        if len(summaries) == limit:
+            last = summaries[-1]
+            next_cursor = (last.created_at, last.session_id)
 
         logger.debug(f"Retrieved {len(summaries)} session summaries")
-        return summaries
+        return SessionPage.model_construct(sessions=summaries, next_cursor=next_cursor)
 
     async def get_user_performance(self, user_id: str) -> UserPerformance | None:
         """Get performance analytics for a user."""
         logger.debug(f"Getting performance analytics for user {user_id}")
 
-        async with get_async_connection() as conn:
+        async with self._connection() as conn:
             # Get basic session counts
             cursor = await conn.execute(
                 """
@@ -255,30 +445,22 @@ class SessionRepository:
             if stats["total"] == 0:
                 return None
 
-            # Get choice accuracy
+            # choice_correct is only set once both the answer and the
+            # recommendation are known, so COUNT skips the rest
             cursor = await conn.execute(
                 """
                 SELECT
-                    user_answer, choices
+                    COUNT(choice_correct) as total,
+                    SUM(choice_correct) as correct
                 FROM sessions
                 WHERE user_id = ? AND state = 'completed'
-                    AND user_answer IS NOT NULL AND choices IS NOT NULL
                 """,
                 (user_id,),
             )
-            choices_data = await cursor.fetchall()
-
-        # Calculate accuracy
-        correct_choices = 0
-        total_choices = 0
-        for row in choices_data:
-            answer = self._deserialize_answer(row["user_answer"])
-            choices = self._deserialize_choices(row["choices"])
-            if answer and choices:
-                total_choices += 1
-                if answer.choice.value == choices.recommend:
-                    correct_choices += 1
+            accuracy_row = await cursor.fetchone()
 
+        total_choices = accuracy_row["total"]
+        correct_choices = accuracy_row["correct"] or 0
         accuracy = correct_choices / total_choices if total_choices > 0 else 0.0
 
         return UserPerformance(
@@ -296,7 +478,7 @@ class SessionRepository:
         """Get system-wide analytics."""
         logger.debug("Getting system-wide analytics")
 
-        async with get_async_connection() as conn:
+        async with self._connection() as conn:
             # Get basic stats
             cursor = await conn.execute(
                 """
@@ -327,7 +509,7 @@ class SessionRepository:
         )
 
         abandonment_points = {
-            SessionState(row["state"]): row["count"] for row in abandonment_rows
+            _STATE_FROM_STR[row["state"]]: row["count"] for row in abandonment_rows
         }
 
         return SessionAnalytics(
@@ -342,19 +524,17 @@ class SessionRepository:
         """Clean up old abandoned sessions."""
         logger.debug(f"Cleaning up sessions older than {older_than_hours} hours")
 
-        async with get_async_connection() as conn:
-            cursor = await conn.execute(
-                """
-                UPDATE sessions
-                SET state = 'abandoned', error_message = 'Session timed out'
-                WHERE state NOT IN ('completed', 'abandoned', 'error')
-                AND datetime(updated_at) < datetime('now', '-' || ? || ' hours')
-                """,
-                (older_than_hours,),
-            )
-            await conn.commit()
+        cutoff = datetime.now(UTC) - timedelta(hours=older_than_hours)
+
+        async with self._connection() as conn:
+            cursor = await conn.execute(_ABANDON_STALE_SQL, (to_epoch_us(cutoff),))
+            await self._commit(conn)
 
             rows_affected = cursor.rowcount
 
+        if rows_affected:
+            # Any cached session may have just been abandoned
+            self._cache.clear()
+
         logger.info(f"Marked {rows_affected} sessions as abandoned")
         return rows_affected
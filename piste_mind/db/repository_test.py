@@ -0,0 +1,161 @@
+"""Tests for SessionRepository."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from piste_mind.db.models import SessionPage, SessionState, TrainingSession
+from piste_mind.db.repository import SessionRepository
+from piste_mind.fixtures import answer_fixture, choices_fixture, scenario_fixture
+from piste_mind.models import AnswerChoice
+
+
+def _session() -> TrainingSession:
+    """A session holding every kind of nested model the cache copies."""
+    return TrainingSession(
+        interface="test",
+        state=SessionState.OPTION_SELECTED,
+        scenario=scenario_fixture(),
+        choices=choices_fixture(),
+        user_answer=answer_fixture().model_copy(),
+    )
+
+
+async def test_cached_session_is_isolated_from_the_written_one() -> None:
+    """Editing a session after writing it doesn't change what is cached."""
+    repository = SessionRepository()
+    session = await repository.create_session(_session())
+
+    session.state = SessionState.ERROR
+    session.user_answer.choice = AnswerChoice.D
+
+    cached = await repository.get_session(session.session_id)
+    assert cached is not None
+    assert cached.state == SessionState.OPTION_SELECTED
+    assert cached.user_answer.choice == AnswerChoice.A
+
+
+async def test_cached_session_is_isolated_from_readers() -> None:
+    """Editing a session read from the cache doesn't change the next read."""
+    repository = SessionRepository()
+    session = await repository.create_session(_session())
+
+    first = await repository.get_session(session.session_id)
+    assert first is not None
+    first.user_answer.explanation = "Changed by the caller, never written back."
+    first.time_to_choice = 99.0
+
+    second = await repository.get_session(session.session_id)
+    assert second is not None
+    assert second.user_answer.explanation == answer_fixture().explanation
+    assert second.time_to_choice is None
+    # Frozen sub-models are shared rather than copied
+    assert second.scenario is first.scenario
+
+
+async def test_cached_session_matches_the_stored_row() -> None:
+    """A cached read returns the same session as a read from the database."""
+    repository = SessionRepository()
+    session = await repository.create_session(_session())
+
+    cached = await repository.get_session(session.session_id)
+    stored = await SessionRepository().get_session(session.session_id)
+
+    assert cached == stored
+
+
+async def test_transaction_commits_every_write_on_exit() -> None:
+    """Writes made through the bound repository are stored together."""
+    repository = SessionRepository()
+    async with repository.transaction() as bound:
+        session = await bound.create_session(_session())
+        session.state = SessionState.COMPLETED
+        await bound.update_session(session, ["state"])
+
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.COMPLETED
+
+
+async def test_transaction_rolls_back_and_forgets_cached_writes() -> None:
+    """A block that raises leaves neither the database nor the cache changed."""
+    repository = SessionRepository()
+    existing = await repository.create_session(_session())
+
+    with pytest.raises(RuntimeError, match="step failed"):
+        async with repository.transaction() as bound:
+            created = await bound.create_session(_session())
+            existing.state = SessionState.ERROR
+            await bound.update_session(existing, ["state"])
+            raise RuntimeError("step failed")
+
+    assert await repository.get_session(created.session_id) is None
+    reread = await repository.get_session(existing.session_id)
+    assert reread is not None
+    assert reread.state == SessionState.OPTION_SELECTED
+
+
+async def _sessions_created_at(
+    repository: SessionRepository, created_at: datetime, count: int
+) -> str:
+    """Store count sessions for one new user, all created at the same instant."""
+    user_id = f"user-{uuid4()}"
+    for _ in range(count):
+        session = _session()
+        session.user_id = user_id
+        session.created_at = created_at
+        await repository.create_session(session)
+    return user_id
+
+
+async def _all_pages(
+    repository: SessionRepository, user_id: str, limit: int
+) -> list[SessionPage]:
+    """Follow next_cursor from the first page to the last."""
+    pages = [await repository.list_sessions(user_id=user_id, limit=limit)]
+    while pages[-1].next_cursor is not None:
+        pages.append(
+            await repository.list_sessions(
+                user_id=user_id, limit=limit, after=pages[-1].next_cursor
+            )
+        )
+    return pages
+
+
+@pytest.mark.parametrize("count", [5, 6])
+async def test_pages_split_sessions_created_at_the_same_time(count: int) -> None:
+    """Ties on created_at are broken by session_id, so none is lost or repeated."""
+    repository = SessionRepository()
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+    user_id = await _sessions_created_at(repository, created_at, count)
+
+    pages = await _all_pages(repository, user_id, limit=2)
+
+    listed = [summary.session_id for page in pages for summary in page.sessions]
+    stored = await repository.list_sessions(user_id=user_id, limit=count + 1)
+    assert listed == sorted(listed, reverse=True)
+    assert listed == [summary.session_id for summary in stored.sessions]
+    assert len(listed) == count
+    assert stored.next_cursor is None
+    # A full final page can't tell it is the last, so one empty page follows
+    assert len(pages[-1].sessions) == count % 2
+
+
+async def test_pages_run_newest_first_across_created_at() -> None:
+    """The cursor continues into older sessions once a timestamp runs out."""
+    repository = SessionRepository()
+    newer = datetime(2024, 5, 2, tzinfo=UTC)
+    user_id = await _sessions_created_at(repository, newer, 3)
+    older = _session()
+    older.user_id = user_id
+    older.created_at = newer - timedelta(microseconds=1)
+    await repository.create_session(older)
+
+    pages = await _all_pages(repository, user_id, limit=2)
+
+    listed = [summary for page in pages for summary in page.sessions]
+    assert [summary.created_at for summary in listed] == [newer] * 3 + [
+        older.created_at
+    ]
+    assert listed[-1].session_id == older.session_id
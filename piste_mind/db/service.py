@@ -8,25 +8,96 @@ from piste_mind.choices import generate_options
 from piste_mind.db.models import SessionState, TrainingSession
 from piste_mind.db.repository import SessionRepository
 from piste_mind.feedback import generate_feedback
-from piste_mind.models import Answer, AnswerChoice
+from piste_mind.models import Answer, AnswerChoice, Challenge, Choices, Scenario
 from piste_mind.scenario import generate_scenario
 
+# Fields written when a generation step fails
+_ERROR_FIELDS = ("state", "error_message", "error_count")
+
+
+# Fields written when an explanation is recorded and when feedback is added
+_EXPLANATION_FIELDS = ("state", "user_answer", "time_to_explanation")
+_FEEDBACK_FIELDS = ("state", "feedback", "total_session_time")
+
 
 class SessionError(Exception):
     """Session-related errors."""
 
 
+def _apply_explanation(session: TrainingSession, explanation: str) -> None:
+    """Add the explanation to a session's answer and advance its state."""
+    if session.state != SessionState.OPTION_SELECTED:
+        raise SessionError(
+            f"Invalid session state for explanation recording: {session.state}"
+        )
+
+    if not session.user_answer:
+        msg = "No choice recorded for this session"
+        raise SessionError(msg)
+
+    # Calculate time to explanation
+    time_elapsed = (datetime.now(UTC) - session.updated_at).total_seconds()
+
+    # Update answer with explanation
+    session.user_answer.explanation = explanation
+    session.time_to_explanation = time_elapsed
+    session.state = SessionState.EXPLANATION_PROVIDED
+
+
+def _check_feedback_ready(
+    session: TrainingSession,
+) -> tuple[Scenario, Choices, Answer]:
+    """Return what feedback is generated from, raising if the session lacks it."""
+    if session.state != SessionState.EXPLANATION_PROVIDED:
+        raise SessionError(
+            f"Invalid session state for feedback generation: {session.state}"
+        )
+
+    scenario, choices, answer = session.scenario, session.choices, session.user_answer
+    if scenario is None or choices is None or answer is None:
+        msg = "Missing required data for feedback generation"
+        raise SessionError(msg)
+    return scenario, choices, answer
+
+
+async def _apply_feedback(
+    session: TrainingSession, inputs: tuple[Scenario, Choices, Answer]
+) -> None:
+    """Generate feedback for a session from its inputs and advance its state."""
+    logger.debug("Calling feedback generation")
+    feedback = await generate_feedback(*inputs)
+
+    session.feedback = feedback
+    session.state = SessionState.FEEDBACK_GENERATED
+    session.total_session_time = (session.time_to_choice or 0) + (
+        session.time_to_explanation or 0
+    )
+
+
 class SessionService:
     """Business logic for session management."""
 
     def __init__(self, repository: SessionRepository | None = None) -> None:
         """Initialize with repository instance."""
         self.repository = repository or SessionRepository()
+        # Sessions created with persist=False, written once their scenario exists
+        self._pending: dict[str, TrainingSession] = {}
 
     async def create_session(
-        self, interface: str, model: str = "haiku", user_id: str | None = None
+        self,
+        interface: str,
+        model: str = "haiku",
+        user_id: str | None = None,
+        *,
+        persist: bool = True,
     ) -> TrainingSession:
-        """Create a new training session."""
+        """Create a new training session.
+
+        With persist=False the session is only held in memory and inserted by
+        generate_scenario_for_session together with its scenario, saving a
+        write and commit. Only pass it when that call follows immediately;
+        until then the session can't be found by any other method.
+        """
         logger.info(f"Creating new {interface} session with {model} model")
 
         session = TrainingSession(
@@ -36,13 +107,30 @@ class SessionService:
             state=SessionState.CREATED,
         )
 
+        if persist:
+            return await self.repository.create_session(session)
+
+        self._pending[session.session_id] = session
+        return session
+
+    async def _save(
+        self, session: TrainingSession, *, is_new: bool, fields: tuple[str, ...]
+    ) -> TrainingSession:
+        """Insert a session still pending in memory, otherwise update fields."""
+        if not is_new:
+            return await self.repository.update_session(session, fields=fields)
+
+        session.updated_at = datetime.now(UTC)
         return await self.repository.create_session(session)
 
     async def generate_scenario_for_session(self, session_id: str) -> TrainingSession:
         """Generate scenario and choices for a session."""
         logger.debug(f"Generating scenario for session {session_id}")
 
-        session = await self.repository.get_session(session_id)
+        session = self._pending.pop(session_id, None)
+        is_new = session is not None
+        if session is None:
+            session = await self.repository.get_session(session_id)
         if not session:
             raise SessionError(f"Session {session_id} not found")
 
@@ -64,44 +152,77 @@ class SessionService:
             session.choices = choices
             session.state = SessionState.SCENARIO_GENERATED
 
-            return await self.repository.update_session(session)
+            return await self._save(
+                session, is_new=is_new, fields=("state", "scenario", "choices")
+            )
 
         except Exception as e:
             logger.error(f"Error generating scenario: {e}")
             session.state = SessionState.ERROR
             session.error_message = str(e)
             session.error_count += 1
-            await self.repository.update_session(session)
+            await self._save(session, is_new=is_new, fields=_ERROR_FIELDS)
             raise SessionError(f"Failed to generate scenario: {e}") from e
 
+    async def prepare_challenge(self) -> Challenge:
+        """Generate a scenario and its choices without creating a session."""
+        logger.debug("Generating scenario ahead of its session")
+        scenario = await generate_scenario()
+
+        logger.debug("Generating choices for scenario")
+        choices = await generate_options(scenario)
+        return Challenge(scenario=scenario, choices=choices)
+
+    async def create_session_for_challenge(
+        self, interface: str, challenge: Challenge, model: str = "haiku"
+    ) -> TrainingSession:
+        """Create a session for a challenge generated by prepare_challenge.
+
+        Insert it only when the challenge is shown, so time_to_choice starts
+        then and the stale-session sweep never sees a challenge still waiting.
+        """
+        logger.info(f"Creating new {interface} session for a prepared challenge")
+
+        session = TrainingSession(
+            interface=interface,
+            model_used=model,
+            state=SessionState.SCENARIO_GENERATED,
+            scenario=challenge.scenario,
+            choices=challenge.choices,
+        )
+        return await self.repository.create_session(session)
+
     async def record_choice(
         self, session_id: str, choice: AnswerChoice
     ) -> TrainingSession:
         """Record user's choice selection."""
         logger.debug(f"Recording choice {choice} for session {session_id}")
 
-        session = await self.repository.get_session(session_id)
-        if not session:
-            raise SessionError(f"Session {session_id} not found")
+        async with self.repository.transaction() as repository:
+            session = await repository.get_session(session_id)
+            if not session:
+                raise SessionError(f"Session {session_id} not found")
 
-        if session.state != SessionState.SCENARIO_GENERATED:
-            raise SessionError(
-                f"Invalid session state for choice recording: {session.state}"
-            )
+            if session.state != SessionState.SCENARIO_GENERATED:
+                raise SessionError(
+                    f"Invalid session state for choice recording: {session.state}"
+                )
 
-        # Calculate time to choice
-        time_elapsed = (datetime.now(UTC) - session.updated_at).total_seconds()
+            # Calculate time to choice
+            time_elapsed = (datetime.now(UTC) - session.updated_at).total_seconds()
 
-        # Create or update answer
-        if session.user_answer:
-            session.user_answer.choice = choice
-        else:
-            session.user_answer = Answer(choice=choice, explanation="")
+            # Create or update answer
+            if session.user_answer:
+                session.user_answer.choice = choice
+            else:
+                session.user_answer = Answer(choice=choice, explanation="")
 
-        session.time_to_choice = time_elapsed
-        session.state = SessionState.OPTION_SELECTED
+            session.time_to_choice = time_elapsed
+            session.state = SessionState.OPTION_SELECTED
 
-        return await self.repository.update_session(session)
+            return await repository.update_session(
+                session, fields=("state", "user_answer", "time_to_choice")
+            )
 
     async def record_explanation(
         self, session_id: str, explanation: str
@@ -109,28 +230,13 @@ class SessionService:
         """Record user's explanation."""
         logger.debug(f"Recording explanation for session {session_id}")
 
-        session = await self.repository.get_session(session_id)
-        if not session:
-            raise SessionError(f"Session {session_id} not found")
-
-        if session.state != SessionState.OPTION_SELECTED:
-            raise SessionError(
-                f"Invalid session state for explanation recording: {session.state}"
-            )
-
-        if not session.user_answer:
-            msg = "No choice recorded for this session"
-            raise SessionError(msg)
-
-        # Calculate time to explanation
-        time_elapsed = (datetime.now(UTC) - session.updated_at).total_seconds()
+        async with self.repository.transaction() as repository:
+            session = await repository.get_session(session_id)
+            if not session:
+                raise SessionError(f"Session {session_id} not found")
 
-        # Update answer with explanation
-        session.user_answer.explanation = explanation
-        session.time_to_explanation = time_elapsed
-        session.state = SessionState.EXPLANATION_PROVIDED
-
-        return await self.repository.update_session(session)
+            _apply_explanation(session, explanation)
+            return await repository.update_session(session, fields=_EXPLANATION_FIELDS)
 
     async def generate_feedback_for_session(self, session_id: str) -> TrainingSession:
         """Generate feedback for a session."""
@@ -140,56 +246,79 @@ class SessionService:
         if not session:
             raise SessionError(f"Session {session_id} not found")
 
-        if session.state != SessionState.EXPLANATION_PROVIDED:
-            raise SessionError(
-                f"Invalid session state for feedback generation: {session.state}"
-            )
-
-        if not all([session.scenario, session.choices, session.user_answer]):
-            msg = "Missing required data for feedback generation"
-            raise SessionError(msg)
+        inputs = _check_feedback_ready(session)
 
         try:
-            # Generate feedback
-            logger.debug("Calling feedback generation")
-            feedback = await generate_feedback(
-                session.scenario, session.choices, session.user_answer
-            )
-
-            # Update session
-            session.feedback = feedback
-            session.state = SessionState.FEEDBACK_GENERATED
-            session.total_session_time = (session.time_to_choice or 0) + (
-                session.time_to_explanation or 0
+            await _apply_feedback(session, inputs)
+            return await self.repository.update_session(
+                session, fields=_FEEDBACK_FIELDS
             )
 
-            return await self.repository.update_session(session)
-
         except Exception as e:
             logger.error(f"Error generating feedback: {e}")
             session.state = SessionState.ERROR
             session.error_message = str(e)
             session.error_count += 1
-            await self.repository.update_session(session)
+            await self.repository.update_session(session, fields=_ERROR_FIELDS)
             raise SessionError(f"Failed to generate feedback: {e}") from e
 
-    async def complete_session(self, session_id: str) -> TrainingSession:
-        """Mark session as completed."""
-        logger.debug(f"Completing session {session_id}")
+    async def explain_and_complete(
+        self, session_id: str, explanation: str
+    ) -> TrainingSession:
+        """Record the explanation, generate feedback and complete the session.
+
+        Equivalent to record_explanation, generate_feedback_for_session and
+        complete_session in turn, but written with a single update.
+        """
+        logger.debug(f"Explaining and completing session {session_id}")
 
         session = await self.repository.get_session(session_id)
         if not session:
             raise SessionError(f"Session {session_id} not found")
 
-        if session.state != SessionState.FEEDBACK_GENERATED:
-            logger.warning(f"Completing session {session_id} in state {session.state}")
+        _apply_explanation(session, explanation)
+        inputs = _check_feedback_ready(session)
+
+        try:
+            await _apply_feedback(session, inputs)
+        except Exception as e:
+            logger.error(f"Error generating feedback: {e}")
+            session.state = SessionState.ERROR
+            session.error_message = str(e)
+            session.error_count += 1
+            await self.repository.update_session(
+                session, fields=_EXPLANATION_FIELDS + _ERROR_FIELDS
+            )
+            raise SessionError(f"Failed to generate feedback: {e}") from e
 
         session.state = SessionState.COMPLETED
         logger.info(
             f"Session {session_id} completed in {session.total_session_time:.1f}s"
         )
+        return await self.repository.update_session(
+            session, fields=_EXPLANATION_FIELDS + _FEEDBACK_FIELDS
+        )
 
-        return await self.repository.update_session(session)
+    async def complete_session(self, session_id: str) -> TrainingSession:
+        """Mark session as completed."""
+        logger.debug(f"Completing session {session_id}")
+
+        async with self.repository.transaction() as repository:
+            session = await repository.get_session(session_id)
+            if not session:
+                raise SessionError(f"Session {session_id} not found")
+
+            if session.state != SessionState.FEEDBACK_GENERATED:
+                logger.warning(
+                    f"Completing session {session_id} in state {session.state}"
+                )
+
+            session.state = SessionState.COMPLETED
+            logger.info(
+                f"Session {session_id} completed in {session.total_session_time:.1f}s"
+            )
+
+            return await repository.update_session(session, fields=("state",))
 
     async def abandon_session(
         self, session_id: str, reason: str = "User abandoned"
@@ -197,21 +326,26 @@ class SessionService:
         """Mark session as abandoned."""
         logger.debug(f"Abandoning session {session_id}: {reason}")
 
-        session = await self.repository.get_session(session_id)
-        if not session:
-            raise SessionError(f"Session {session_id} not found")
+        async with self.repository.transaction() as repository:
+            session = await repository.get_session(session_id)
+            if not session:
+                raise SessionError(f"Session {session_id} not found")
 
-        session.state = SessionState.ABANDONED
-        session.error_message = reason
+            session.state = SessionState.ABANDONED
+            session.error_message = reason
 
-        return await self.repository.update_session(session)
+            return await repository.update_session(
+                session, fields=("state", "error_message")
+            )
 
     async def get_or_create_session(
         self, session_id: str | None, interface: str, model: str = "haiku"
     ) -> TrainingSession:
         """Get existing session or create new one."""
         if session_id:
-            session = await self.repository.get_session(session_id)
+            session = self._pending.get(session_id)
+            if session is None:
+                session = await self.repository.get_session(session_id)
             if session:
                 return session
 
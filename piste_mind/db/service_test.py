@@ -0,0 +1,159 @@
+"""Tests for SessionService state transitions."""
+
+import pytest
+
+from piste_mind.db.models import SessionState, TrainingSession
+from piste_mind.db.repository import SessionRepository
+from piste_mind.db.service import SessionError, SessionService
+from piste_mind.fixtures import (
+    answer_fixture,
+    choices_fixture,
+    feedback_fixture,
+    scenario_fixture,
+)
+from piste_mind.models import Answer, AnswerChoice
+
+EXPLANATION = "The opponent pulls distance, so a broken tempo lands the fleche."
+
+
+async def _option_selected_session(service: SessionService) -> TrainingSession:
+    """Insert a session that is waiting for the user's explanation."""
+    session = TrainingSession(
+        interface="test",
+        state=SessionState.OPTION_SELECTED,
+        scenario=scenario_fixture(),
+        choices=choices_fixture(),
+        user_answer=Answer.model_construct(choice=AnswerChoice.B, explanation=""),
+        time_to_choice=3.0,
+    )
+    return await service.repository.create_session(session)
+
+
+async def test_explain_and_complete_stores_explanation_and_feedback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The explanation and feedback land together and the session completes."""
+    calls = []
+
+    async def fake_generate_feedback(scenario, choices, answer):
+        calls.append((scenario, choices, answer))
+        return feedback_fixture()
+
+    monkeypatch.setattr(
+        "piste_mind.db.service.generate_feedback", fake_generate_feedback
+    )
+    service = SessionService()
+    session = await _option_selected_session(service)
+
+    result = await service.explain_and_complete(session.session_id, EXPLANATION)
+
+    assert result.state == SessionState.COMPLETED
+    assert len(calls) == 1
+    assert calls[0][2].explanation == EXPLANATION
+
+    # Read back through a fresh repository so the row, not a cache, is checked
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.COMPLETED
+    assert stored.user_answer is not None
+    assert stored.user_answer.explanation == EXPLANATION
+    assert stored.feedback == feedback_fixture()
+    assert stored.time_to_explanation is not None
+    assert stored.total_session_time == pytest.approx(
+        3.0 + stored.time_to_explanation
+    )
+
+
+async def test_explain_and_complete_keeps_explanation_when_feedback_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A feedback failure still records the explanation alongside the error."""
+
+    async def failing_generate_feedback(scenario, choices, answer):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(
+        "piste_mind.db.service.generate_feedback", failing_generate_feedback
+    )
+    service = SessionService()
+    session = await _option_selected_session(service)
+
+    with pytest.raises(SessionError, match="model unavailable"):
+        await service.explain_and_complete(session.session_id, EXPLANATION)
+
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.ERROR
+    assert stored.error_message == "model unavailable"
+    assert stored.error_count == 1
+    assert stored.user_answer is not None
+    assert stored.user_answer.explanation == EXPLANATION
+    assert stored.feedback is None
+
+
+async def test_explain_and_complete_rejects_session_without_choice() -> None:
+    """Only sessions with a recorded choice can be explained."""
+    service = SessionService()
+    session = await service.repository.create_session(
+        TrainingSession(interface="test", state=SessionState.SCENARIO_GENERATED)
+    )
+
+    with pytest.raises(SessionError, match="Invalid session state"):
+        await service.explain_and_complete(session.session_id, EXPLANATION)
+
+
+async def test_explain_and_complete_rejects_missing_feedback_inputs() -> None:
+    """A session without its scenario can't have feedback generated."""
+    service = SessionService()
+    session = await service.repository.create_session(
+        TrainingSession(
+            interface="test",
+            state=SessionState.OPTION_SELECTED,
+            user_answer=answer_fixture(),
+        )
+    )
+
+    with pytest.raises(SessionError, match="Missing required data"):
+        await service.explain_and_complete(session.session_id, EXPLANATION)
+
+
+async def test_create_session_persists_by_default() -> None:
+    """A new session can be found, and abandoned, straight away."""
+    service = SessionService()
+
+    session = await service.create_session("test")
+
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.CREATED
+    abandoned = await service.abandon_session(session.session_id)
+    assert abandoned.state == SessionState.ABANDONED
+
+
+async def test_unpersisted_session_is_inserted_with_its_scenario(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """persist=False defers the insert until the scenario is generated."""
+
+    async def fake_generate_scenario(**kwargs):
+        return scenario_fixture()
+
+    async def fake_generate_options(scenario):
+        return choices_fixture()
+
+    monkeypatch.setattr(
+        "piste_mind.db.service.generate_scenario", fake_generate_scenario
+    )
+    monkeypatch.setattr("piste_mind.db.service.generate_options", fake_generate_options)
+    service = SessionService()
+
+    session = await service.create_session("test", persist=False)
+    assert await SessionRepository().get_session(session.session_id) is None
+
+    await service.generate_scenario_for_session(session.session_id)
+
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.SCENARIO_GENERATED
+    assert stored.scenario == scenario_fixture()
+    assert not service._pending
@@ -7,6 +7,9 @@ When run as a module, provides CLI options to test editor functionality:
     python -m piste_mind.editor                   # Same as --mode both
 """
 
+import asyncio
+import functools
+import re
 from typing import TypeVar
 
 from loguru import logger
@@ -14,15 +17,16 @@ from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.anthropic import AnthropicModel
 
-from piste_mind.agent import MODEL, load_prompt_template, run_agent
+from piste_mind.agent import MODEL, cached_agent, load_prompt_template, run_agent
+from piste_mind.models import OPTION_LETTERS, Challenge, Choices
 
 T = TypeVar("T", bound=BaseModel)
 
 
-def create_editor_agent[T: BaseModel](
-    output_type: type[T], model: AnthropicModel = MODEL
+def _new_editor_agent[T: BaseModel](
+    output_type: type[T], model: AnthropicModel
 ) -> Agent[T]:
-    """Create a generic editor agent."""
+    """Build an editor agent producing output_type."""
     logger.info("Creating editor agent with temperature=0.3")
     return Agent(
         model=model,
@@ -32,31 +36,92 @@ def create_editor_agent[T: BaseModel](
     )  # type: ignore[return-value]
 
 
-async def edit_content[T: BaseModel](
-    content: T,
-    model: AnthropicModel = MODEL,
-) -> T:
-    """Edit content for better readability.
+def create_editor_agent[T: BaseModel](
+    output_type: type[T], model: AnthropicModel = MODEL
+) -> Agent[T]:
+    """Create a generic editor agent, reused per output type and model."""
+    return cached_agent(
+        ("editor", output_type),
+        model,
+        functools.partial(_new_editor_agent, output_type),
+    )
 
-    Args:
-        content: Either Challenge or Feedback instance to edit
-        model: AI model to use
 
-    Returns:
-        New instance of the same type with edited content
-    """
+# Below this many characters of text the editor rarely changes anything
+EDIT_MIN_CHARS = 1000
+
+# Flesch reading ease at or above this reads as plain English
+READABLE_SCORE = 60.0
+
+_SENTENCE_END = re.compile(r"[.!?]+")
+_WORD = re.compile(r"[A-Za-z']+")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+
+
+def _syllables(word: str) -> int:
+    """Estimate syllables as vowel groups, not counting a silent final e."""
+    word = word.lower()
+    count = len(_VOWEL_GROUP.findall(word))
+    if word.endswith("e") and not word.endswith("le") and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def reading_ease(text: str) -> float:
+    """Flesch reading ease of text; higher is easier, 60-70 is plain English."""
+    words = _WORD.findall(text)
+    if not words:
+        return 100.0
+    sentences = max(len(_SENTENCE_END.findall(text)), 1)
+    syllables = sum(_syllables(word) for word in words)
+    return 206.835 - 1.015 * (len(words) / sentences) - 84.6 * (syllables / len(words))
+
+
+def _text_fields(content: BaseModel) -> list[str]:
+    """The string fields of content, recursively, with lists flattened."""
+    texts = []
+    for value in content.__dict__.values():
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, list):
+            texts.extend(item for item in value if isinstance(item, str))
+        elif isinstance(value, BaseModel):
+            texts.extend(_text_fields(value))
+    return texts
+
+
+def _reads_easily(texts: list[str]) -> bool:
+    """Whether every text scores at least READABLE_SCORE."""
+    return all(reading_ease(text) >= READABLE_SCORE for text in texts)
+
+
+def _needs_edit(content: BaseModel) -> bool:
+    """Whether content is long enough to edit and some of it reads poorly."""
+    texts = _text_fields(content)
+    if sum(len(text) for text in texts) < EDIT_MIN_CHARS:
+        return False
+    return not _reads_easily(texts)
+
+
+async def _edit_model[T: BaseModel](content: T, model: AnthropicModel) -> T:
+    """Send one content model through the editor agent."""
     content_type = type(content).__name__
     logger.info(f"Editing {content_type} for improved readability")
 
-    logger.debug(f"Creating agent for {content_type} editing")
+    logger.debug(f"Getting agent for {content_type} editing")
     agent = create_editor_agent(output_type=type(content), model=model)
 
+    # Edited models hold only plain fields (a Challenge is split first), so
+    # the instance dict serializes as-is without a model_dump walk
     logger.debug(f"Converting {content_type} to dict for template")
-    content_dict = content.model_dump()
+    content_dict = dict(content.__dict__)
 
     logger.debug("Loading and rendering editor prompt template")
     prompt = load_prompt_template("editor.j2", content=content_dict)
-    logger.debug(f"Prompt for {content_type} editing: {prompt}")
+    # Lazy: only build the multi-KB message when DEBUG is actually enabled
+    logger.opt(lazy=True).debug(
+        "Prompt for {} editing: {}", lambda: content_type, lambda: prompt
+    )
 
     logger.debug(f"Running agent to edit {content_type}")
     edited = await run_agent(
@@ -66,66 +131,127 @@ async def edit_content[T: BaseModel](
         operation_name=f"{content_type.lower()} editing",
     )
 
-    logger.info(f"{content_type} editing completed successfully: {edited}")
+    logger.info(f"{content_type} editing completed successfully")
+    logger.opt(lazy=True).debug("Edited {}: {}", lambda: content_type, lambda: edited)
     return edited
 
 
-if __name__ == "__main__":
-    import asyncio
+async def _edit_part[T: BaseModel](
+    content: T, model: AnthropicModel, *, force: bool
+) -> T:
+    """Edit one half of a challenge unless all of its text reads easily."""
+    if not force and _reads_easily(_text_fields(content)):
+        logger.info(f"{type(content).__name__} already reads easily, skipping editor")
+        return content
+    return await _edit_model(content, model)
+
 
+async def _edit_challenge(
+    challenge: Challenge, model: AnthropicModel, *, force: bool
+) -> Challenge:
+    """Edit a challenge's scenario and choices as two concurrent requests.
+
+    The choices are edited together so the four options keep a consistent
+    voice, and the recommendation is carried over rather than re-generated.
+    """
+    scenario, choices = await asyncio.gather(
+        _edit_part(challenge.scenario, model, force=force),
+        _edit_part(challenge.choices, model, force=force),
+    )
+    # Both halves were validated by their agents; skip revalidating them
+    return Challenge.model_construct(
+        scenario=scenario,
+        choices=Choices.model_construct(
+            options=choices.options, recommend=challenge.choices.recommend
+        ),
+    )
+
+
+async def edit_content[T: BaseModel](
+    content: T,
+    model: AnthropicModel = MODEL,
+    *,
+    force: bool = False,
+) -> T:
+    """Edit content for better readability.
+
+    A Challenge is split into its scenario and choices, which are edited in
+    parallel so the wait is the slower of the two rather than their sum.
+    Unless forced, content is returned unchanged without a request when its
+    text is shorter than EDIT_MIN_CHARS or all of it scores READABLE_SCORE
+    or more; a Challenge's halves are then each skipped if they read easily.
+
+    Args:
+        content: Challenge, Feedback or another content model to edit
+        model: AI model to use
+        force: Edit regardless of length and readability
+
+    Returns:
+        New instance of the same type with edited content
+    """
+    if not force and not _needs_edit(content):
+        logger.info(
+            f"{type(content).__name__} is short or reads easily, skipping editor"
+        )
+        return content
+
+    if isinstance(content, Challenge):
+        return await _edit_challenge(content, model, force=force)  # type: ignore[return-value]
+    return await _edit_model(content, model)
+
+
+if __name__ == "__main__":
     import click
 
+    from piste_mind.feedback import format_feedback
     from piste_mind.fixtures import challenge_fixture, feedback_fixture
 
+    # Each test prints its report only after its edit returns, so the two
+    # can run concurrently without interleaving their output
+
     async def test_challenge_editing() -> None:
         """Test Challenge editing functionality."""
+        challenge = challenge_fixture()
+
+        logger.debug("Editing challenge for better readability")
+        edited_challenge = await edit_content(challenge, force=True)
+
         print("\n" + "=" * 80)
         print("TESTING CHALLENGE EDITING")
         print("=" * 80)
 
-        challenge = challenge_fixture()
-
         print("\n[BEFORE] ORIGINAL CHALLENGE:")
         print("-" * 40)
         print(f"Scenario: {challenge.scenario.scenario}")
         print("\nChoices:")
         for i, choice in enumerate(challenge.choices.options):
-            print(f"\n{chr(65 + i)}. {choice}")
-
-        logger.debug("Editing challenge for better readability")
-        edited_challenge = await edit_content(challenge)
+            print(f"\n{OPTION_LETTERS[i]}. {choice}")
 
         print("\n\n[AFTER] EDITED CHALLENGE:")
         print("-" * 40)
         print(f"Scenario: {edited_challenge.scenario.scenario}")
         print("\nChoices:")
         for i, choice in enumerate(edited_challenge.choices.options):
-            print(f"\n{chr(65 + i)}. {choice}")
+            print(f"\n{OPTION_LETTERS[i]}. {choice}")
 
     async def test_feedback_editing() -> None:
         """Test Feedback editing functionality."""
+        feedback = feedback_fixture()
+
+        logger.debug("Editing feedback for better readability")
+        edited_feedback = await edit_content(feedback, force=True)
+
         print("\n\n" + "=" * 80)
         print("TESTING FEEDBACK EDITING")
         print("=" * 80)
 
-        feedback = feedback_fixture()
-
         print("\n[BEFORE] ORIGINAL FEEDBACK:")
         print("-" * 40)
-        print(f"\nAcknowledgment:\n{feedback.acknowledgment}")
-        print(f"\nAnalysis:\n{feedback.analysis}")
-        print(f"\nAdvanced Concepts:\n{feedback.advanced_concepts}")
-        print(f"\nBridge to Mastery:\n{feedback.bridge_to_mastery}")
-
-        logger.debug("Editing feedback for better readability")
-        edited_feedback = await edit_content(feedback)
+        print(format_feedback(feedback))
 
         print("\n\n[AFTER] EDITED FEEDBACK:")
         print("-" * 40)
-        print(f"\nAcknowledgment:\n{edited_feedback.acknowledgment}")
-        print(f"\nAnalysis:\n{edited_feedback.analysis}")
-        print(f"\nAdvanced Concepts:\n{edited_feedback.advanced_concepts}")
-        print(f"\nBridge to Mastery:\n{edited_feedback.bridge_to_mastery}")
+        print(format_feedback(edited_feedback))
 
     @click.command()
     @click.option(
@@ -138,11 +264,14 @@ if __name__ == "__main__":
         """Test the editor functionality with different modes."""
 
         async def run_tests() -> None:
+            tests = []
             if mode in ["challenge", "both"]:
-                await test_challenge_editing()
+                tests.append(test_challenge_editing())
 
             if mode in ["feedback", "both"]:
-                await test_feedback_editing()
+                tests.append(test_feedback_editing())
+
+            await asyncio.gather(*tests)
 
         asyncio.run(run_tests())
 
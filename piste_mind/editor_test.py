@@ -0,0 +1,56 @@
+"""Tests for the editor's length and readability gate."""
+
+import pytest
+
+from piste_mind import editor
+from piste_mind.fixtures import challenge_fixture, feedback_fixture
+from piste_mind.models import Scenario
+
+# One plain sentence repeated past EDIT_MIN_CHARS; it scores well above 60
+_READABLE = Scenario(scenario="You lunge and she parries. " * 50)
+
+
+@pytest.fixture
+def edited(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the type of every model sent to the editor agent."""
+    calls = []
+
+    async def edit_model(content, model):
+        calls.append(type(content).__name__)
+        return content
+
+    monkeypatch.setattr(editor, "_edit_model", edit_model)
+    return calls
+
+
+async def test_readable_text_is_not_edited(edited: list[str]) -> None:
+    """Long text that already reads easily skips the agent."""
+    assert editor.reading_ease(_READABLE.scenario) >= editor.READABLE_SCORE
+
+    assert await editor.edit_content(_READABLE) is _READABLE
+    assert edited == []
+
+
+async def test_short_text_is_not_edited(edited: list[str]) -> None:
+    """Hard text shorter than EDIT_MIN_CHARS skips the agent."""
+    short = Scenario(scenario="Counterattacking preparation notwithstanding. " * 3)
+    assert editor.reading_ease(short.scenario) < editor.READABLE_SCORE
+
+    await editor.edit_content(short)
+
+    assert edited == []
+
+
+async def test_force_edits_readable_text(edited: list[str]) -> None:
+    """force sends content to the agent whatever its length or score."""
+    await editor.edit_content(_READABLE, force=True)
+    await editor.edit_content(challenge_fixture(), force=True)
+
+    assert edited == ["Scenario", "Scenario", "Choices"]
+
+
+async def test_long_hard_text_is_edited(edited: list[str]) -> None:
+    """The fixtures are long and technical enough to need the editor."""
+    await editor.edit_content(feedback_fixture())
+
+    assert edited == ["Feedback"]
@@ -1,49 +1,95 @@
 """Feedback generation agent for tactical epee coaching."""
 
+import functools
+
 from loguru import logger
 from pydantic_ai import Agent
 
 from piste_mind.agent import MODEL, load_prompt_template, run_agent
-from piste_mind.models import Answer, Choices, Feedback, Scenario
-
-# Create agent for generating coaching feedback
-logger.info("Creating feedback agent with temperature=0.3")
-feedback_agent = Agent(
-    model=MODEL,
-    output_type=Feedback,
-    system_prompt="You are an expert epee fencing coach providing detailed tactical feedback.",
-    model_settings={
-        "temperature": 0.3
-    },  # Lower temperature for more consistent feedback
-)
-logger.debug("Feedback agent initialized successfully")
-
-
-async def generate_feedback(
-    scenario: Scenario, options: Choices, answer: Answer
-) -> Feedback:
-    """Generate coaching feedback for a student's answer using the AI agent."""
-    logger.debug(f"Student chose option {answer.choice}: {answer.explanation}")
+from piste_mind.models import OPTION_LETTERS, Answer, Choices, Feedback, Scenario
+
+
+@functools.cache
+def _get_feedback_agent() -> Agent[Feedback]:
+    """Create the coaching feedback agent on first use."""
+    logger.info("Creating feedback agent with temperature=0.3")
+    agent = Agent(
+        model=MODEL,
+        output_type=Feedback,
+        system_prompt="You are an expert epee fencing coach providing detailed tactical feedback.",
+        model_settings={
+            "temperature": 0.3
+        },  # Lower temperature for more consistent feedback
+    )
+    logger.debug("Feedback agent initialized successfully")
+    return agent  # type: ignore[return-value]
+
+
+def _feedback_prompt(
+    scenario: Scenario,
+    options: Choices,
+    answer: Answer,
+    *,
+    include_recommendation: bool,
+) -> str:
+    """Render the feedback prompt for a student's answer."""
+    logger.opt(lazy=True).debug(
+        "Student chose option {}: {}", lambda: answer.choice, lambda: answer.explanation
+    )
 
     # Create a combined object for the template
     problem = {
         "question": scenario.scenario,
         "options": options.options,
-        "recommendation": chr(65 + options.recommend),  # Convert index to letter
     }
+    if include_recommendation:
+        problem["recommendation"] = OPTION_LETTERS[options.recommend]
 
     # Load and render the prompt template with context
-    prompt = load_prompt_template("feedback.j2", problem=problem, user_response=answer)
+    return load_prompt_template("feedback.j2", problem=problem, user_response=answer)
+
+
+async def generate_feedback(
+    scenario: Scenario,
+    options: Choices,
+    answer: Answer,
+    *,
+    include_recommendation: bool = True,
+) -> Feedback:
+    """Generate coaching feedback for a student's answer using the AI agent.
+
+    Pass include_recommendation=False to leave the coach's recommended option
+    out of the prompt and have the answer judged on its own merits.
+    """
+    prompt = _feedback_prompt(
+        scenario, options, answer, include_recommendation=include_recommendation
+    )
 
     # Run the agent and get the feedback
     return await run_agent(
-        agent=feedback_agent,
+        agent=_get_feedback_agent(),
         prompt=prompt,
         expected_type=Feedback,
         operation_name="feedback generation",
     )
 
 
+# Feedback fields in reading order, with their display titles
+FEEDBACK_SECTIONS = (
+    ("Acknowledgment", "acknowledgment"),
+    ("Analysis", "analysis"),
+    ("Advanced Concepts", "advanced_concepts"),
+    ("Bridge to Mastery", "bridge_to_mastery"),
+)
+
+
+def format_feedback(feedback: Feedback) -> str:
+    """Render feedback as titled plain-text sections."""
+    return "\n".join(
+        f"\n{title}:\n{getattr(feedback, field)}" for title, field in FEEDBACK_SECTIONS
+    )
+
+
 if __name__ == "__main__":
     import asyncio
 
@@ -70,19 +116,14 @@ if __name__ == "__main__":
         )
 
         print(f"\nScenario: {scenario.scenario[:100]}...")
-        print(f"Coach recommends: Option {chr(65 + options.recommend)}")
+        print(f"Coach recommends: Option {OPTION_LETTERS[options.recommend]}")
         print(f"User chose: Option {answer.choice}")
         print(f"User's explanation: {answer.explanation}")
 
         feedback = await generate_feedback(scenario, options, answer)
 
         # Display feedback
-        print(f"\n{'=' * 80}")
-        print("GENERATED FEEDBACK:")
-        print(f"\nAcknowledgment:\n{feedback.acknowledgment}")
-        print(f"\nAnalysis:\n{feedback.analysis}")
-        print(f"\nAdvanced Concepts:\n{feedback.advanced_concepts}")
-        print(f"\nBridge to Mastery:\n{feedback.bridge_to_mastery}")
+        print(f"\n{'=' * 80}\nGENERATED FEEDBACK:\n{format_feedback(feedback)}")
 
     async def test_different_choice() -> None:
         """Test when user's choice differs from coach's recommendation."""
@@ -102,22 +143,17 @@ if __name__ == "__main__":
         )
 
         print(f"\nScenario: {scenario.scenario[:100]}...")
-        print(f"Coach recommends: Option {chr(65 + options.recommend)}")
+        print(f"Coach recommends: Option {OPTION_LETTERS[options.recommend]}")
         print(f"User chose: Option {answer.choice}")
         print(f"User's explanation: {answer.explanation}")
 
         feedback = await generate_feedback(scenario, options, answer)
 
         # Display feedback
-        print(f"\n{'=' * 80}")
-        print("GENERATED FEEDBACK:")
-        print(f"\nAcknowledgment:\n{feedback.acknowledgment}")
-        print(f"\nAnalysis:\n{feedback.analysis}")
-        print(f"\nAdvanced Concepts:\n{feedback.advanced_concepts}")
-        print(f"\nBridge to Mastery:\n{feedback.bridge_to_mastery}")
+        print(f"\n{'=' * 80}\nGENERATED FEEDBACK:\n{format_feedback(feedback)}")
 
         logger.debug("Saving feedback to session")
-        save_session(feedback, SessionType.FEEDBACK)
+        await save_session(feedback, SessionType.FEEDBACK)
 
     @click.command()
     @click.option(
@@ -6,7 +6,7 @@ import random
 from dataclasses import dataclass
 from enum import IntEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Constants
 NUM_OPTIONS = 4
@@ -510,6 +510,9 @@ class ScenarioContext(BaseModel):
 class Scenario(BaseModel):
     """A tactical epee scenario without options."""
 
+    # Generated content is never mutated in place, only replaced
+    model_config = ConfigDict(frozen=True)
+
     scenario: str = Field(
         ...,
         description="Detailed tactical scenario including score, time, and opponent analysis",
@@ -520,6 +523,8 @@ class Scenario(BaseModel):
 class Choices(BaseModel):
     """Strategic choices for a tactical scenario."""
 
+    model_config = ConfigDict(frozen=True)
+
     options: list[str] = Field(
         ...,
         description="Four distinct tactical approaches to the scenario",
@@ -537,6 +542,9 @@ class Choices(BaseModel):
 class Challenge(BaseModel):
     """A complete challenge containing scenario and choices."""
 
+    # Build the validator on first use rather than at import
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     scenario: Scenario
     choices: Choices
 
@@ -554,6 +562,10 @@ class AnswerChoice(IntEnum):
         return self.name
 
 
+# Option letters indexed by option number, e.g. OPTION_LETTERS[recommend]
+OPTION_LETTERS = tuple(choice.name for choice in AnswerChoice)
+
+
 class Answer(BaseModel):
     """A student's response to a tactical scenario."""
 
@@ -570,6 +582,8 @@ class Answer(BaseModel):
 class Feedback(BaseModel):
     """Coaching feedback on a student's tactical decision."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     acknowledgment: str = Field(
         ...,
         description="Recognition of what the student correctly identified",
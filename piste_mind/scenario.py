@@ -4,12 +4,12 @@ from loguru import logger
 from pydantic_ai import Agent
 from pydantic_ai.models.anthropic import AnthropicModel
 
-from piste_mind.agent import MODEL, load_prompt_template, run_agent
+from piste_mind.agent import MODEL, cached_agent, load_prompt_template, run_agent
 from piste_mind.models import Scenario, generate_full_context
 
 
-def create_scenario_agent(model: AnthropicModel = MODEL) -> Agent[Scenario]:
-    """Create agent for generating tactical scenarios."""
+def _new_scenario_agent(model: AnthropicModel) -> Agent[Scenario]:
+    """Build the tactical scenario agent for model."""
     logger.info("Creating scenario agent with temperature=0.7")
     agent = Agent(
         model=model,
@@ -22,6 +22,11 @@ def create_scenario_agent(model: AnthropicModel = MODEL) -> Agent[Scenario]:
     return agent  # type: ignore[return-value]
 
 
+def create_scenario_agent(model: AnthropicModel = MODEL) -> Agent[Scenario]:
+    """Create agent for generating tactical scenarios, reused per model."""
+    return cached_agent("scenario", model, _new_scenario_agent)
+
+
 async def generate_scenario(model: AnthropicModel = MODEL) -> Scenario:
     """Generate a new tactical epee scenario using the AI agent."""
     logger.debug("Generating full context")
@@ -57,7 +62,7 @@ if __name__ == "__main__":
         print(f"\n{'=' * 80}\n{scenario.scenario}\n{'=' * 80}")
 
         logger.debug("Saving scenario to session")
-        session_path = save_session(scenario, SessionType.QUESTION)
+        session_path = await save_session(scenario, SessionType.QUESTION)
         print(f"\nSaved to: {session_path}")
 
     asyncio.run(main())
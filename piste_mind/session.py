@@ -1,8 +1,8 @@
 """Session management for piste-mind training sessions."""
 
-import json
+import asyncio
+import functools
 import time
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
@@ -19,7 +19,14 @@ class SessionType(Enum):
     FEEDBACK = "feedback"
 
 
-def save_session(
+@functools.cache
+def _session_dir(base_dir: Path) -> Path:
+    """Create a session directory on its first use in this process."""
+    base_dir.mkdir(exist_ok=True)
+    return base_dir
+
+
+async def save_session(
     data: BaseModel,
     session_type: SessionType,
     base_dir: Path | None = None,
@@ -35,19 +42,17 @@ def save_session(
         Path to the saved file
     """
     logger.debug("Setting up base directory for session storage")
-    base_dir = base_dir or Path.cwd() / "sessions"
-    base_dir.mkdir(exist_ok=True)
+    base_dir = _session_dir(base_dir or Path.cwd() / "sessions")
 
     logger.debug("Generating timestamp and session name")
-    timestamp = time.time()
-    # Use local timezone - DTZ006 is intentionally ignored here
-    dt = datetime.fromtimestamp(timestamp)  # noqa: DTZ006
-    session_name = dt.strftime("%Y%m%d-%H%M%S")
+    # Local time, formatted without building a datetime
+    session_name = time.strftime("%Y%m%d-%H%M%S", time.localtime())
 
     logger.debug(f"Saving {session_type.value} session to file")
     file_path = base_dir / f"{session_name}_{session_type.value}.json"
-    with file_path.open("w") as f:
-        json.dump(data.model_dump(), f, indent=2)
+    # pydantic-core serializes the model in one pass, with no dict in between;
+    # the write runs in a thread so callers' event loops aren't blocked on disk
+    await asyncio.to_thread(file_path.write_text, data.model_dump_json(indent=2))
 
     logger.debug(f"Saved {session_type.value} to {file_path}")
     return file_path
@@ -1,32 +1,57 @@
 """Web interface for piste-mind using FastHTML."""
 
+import asyncio
 import os
+import re
+import sys
+from collections import Counter
 from typing import Any
 
 from fasthtml.common import (
+    FT,
     H1,
     H2,
     H3,
+    Body,
     Button,
     Div,
     Form,
+    Head,
     Hidden,
+    Html,
+    HTMLResponse,
+    HtmxHeaders,
+    HttpHeader,
     Input,
     Label,
     Meta,
+    NotStr,
     P,
+    Redirect,
+    Response,
     Script,
     Style,
     Textarea,
     Title,
     fast_app,
+    to_xml,
 )
 from loguru import logger
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from piste_mind.agent import ModelType, get_model, parse_model_type_from_env
+from piste_mind.db.connection import close_async_connection
+from piste_mind.db.models import TrainingSession
 from piste_mind.db.service import SessionService
 from piste_mind.editor import edit_content
-from piste_mind.models import AnswerChoice, Challenge
+from piste_mind.models import (
+    NUM_OPTIONS,
+    OPTION_LETTERS,
+    AnswerChoice,
+    Challenge,
+    Feedback,
+)
 
 # Initialize session service
 session_service = SessionService()
@@ -38,12 +63,84 @@ except ValueError:
     model_type = ModelType.HAIKU
 model = get_model(model_type)
 
-# Create the FastHTML app
-app, rt = fast_app(
-    hdrs=(
-        Script(src="https://cdn.tailwindcss.com"),
-        Script(src="https://unpkg.com/htmx.org@2.0.0"),
-        Meta(name="viewport", content="width=device-width, initial-scale=1"),
+# Challenges generated and edited while the user reads the current one, so
+# the next page load can skip the multi-second generation. Each is held as
+# (generated, edited); its session is only inserted when it is served.
+PREFETCH_DEPTH = 2
+_prefetched: asyncio.Queue[tuple[Challenge, Challenge]] = asyncio.Queue(
+    maxsize=PREFETCH_DEPTH
+)
+_prefetch_tasks: set[asyncio.Task[None]] = set()
+# Page loads served from the queue ("hit") or prepared inline ("miss")
+_prefetch_stats: Counter[str] = Counter()
+
+
+async def _prepare_challenge() -> tuple[TrainingSession, Challenge]:
+    """Create a session, generate its challenge and edit it for display."""
+    logger.info("Creating new training session")
+    # Generated straight away, so the session is inserted with its scenario
+    session = await session_service.create_session(
+        "web", model_type.name.lower(), persist=False
+    )
+
+    logger.debug("Generating scenario and options for web interface")
+    session = await session_service.generate_scenario_for_session(session.session_id)
+
+    assert session.scenario is not None, "Scenario should be generated"
+    assert session.choices is not None, "Choices should be generated"
+    challenge = Challenge(scenario=session.scenario, choices=session.choices)
+    return session, await edit_content(challenge, model)
+
+
+async def _prefetch_challenge() -> None:
+    """Generate and edit a challenge in the background for the next page."""
+    try:
+        challenge = await session_service.prepare_challenge()
+        _prefetched.put_nowait((challenge, await edit_content(challenge, model)))
+    except Exception as e:
+        # Nobody awaits this task; the next page load generates its own
+        logger.warning(f"Prefetching a challenge failed: {e}")
+
+
+def _schedule_prefetch() -> None:
+    """Top the prefetch queue up to PREFETCH_DEPTH challenges."""
+    for _ in range(PREFETCH_DEPTH - _prefetched.qsize() - len(_prefetch_tasks)):
+        task = asyncio.create_task(_prefetch_challenge())
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
+
+
+async def _next_challenge() -> tuple[TrainingSession, Challenge]:
+    """Take a prefetched challenge, or prepare one now if none is ready."""
+    try:
+        challenge, edited = _prefetched.get_nowait()
+    except asyncio.QueueEmpty:
+        _prefetch_stats["miss"] += 1
+        prepared = await _prepare_challenge()
+    else:
+        _prefetch_stats["hit"] += 1
+        session = await session_service.create_session_for_challenge(
+            "web", challenge, model_type.name.lower()
+        )
+        prepared = session, edited
+    _schedule_prefetch()
+    logger.info(
+        f"Prefetch hits {_prefetch_stats['hit']}, misses {_prefetch_stats['miss']}"
+    )
+    return prepared
+
+
+async def _cancel_prefetch() -> None:
+    """Cancel prefetches still running at shutdown."""
+    for task in _prefetch_tasks:
+        task.cancel()
+    await asyncio.gather(*_prefetch_tasks, return_exceptions=True)
+
+
+# Page styles, rendered to markup once; FastHTML emits NotStr verbatim
+# instead of walking and escaping a component for every page
+_STYLE_HTML = NotStr(
+    to_xml(
         Style("""
             [x-cloak] { display: none !important; }
             .htmx-indicator { display: none; }
@@ -71,21 +168,17 @@ app, rt = fast_app(
             .animate-fade-in {
                 animation: fade-in 0.5s ease-out;
             }
+            /* Animations only touch transform and opacity, which the
+               compositor handles without re-running layout */
             @keyframes slide-down {
-                from {
-                    opacity: 0;
-                    max-height: 0;
-                    transform: translateY(-10px);
-                }
-                to {
-                    opacity: 1;
-                    max-height: 500px;
-                    transform: translateY(0);
-                }
+                from { opacity: 0; transform: translateY(-10px); }
+                to { opacity: 1; transform: translateY(0); }
             }
             .animate-slide-down {
                 animation: slide-down 0.3s ease-out;
-                overflow: hidden;
+            }
+            @media (prefers-reduced-motion: reduce) {
+                .animate-fade-in, .animate-slide-down { animation: none; }
             }
             /* Custom radio button styles */
             input[type="radio"]:checked + div .option-circle {
@@ -97,107 +190,190 @@ app, rt = fast_app(
             }
             /* Progress bar animation */
             @keyframes progress {
-                0% { width: 0%; }
-                30% { width: 30%; }
-                60% { width: 60%; }
-                90% { width: 90%; }
-                100% { width: 100%; }
+                from { transform: scaleX(0); }
+                to { transform: scaleX(1); }
             }
             .progress-bar {
+                transform-origin: left;
                 animation: progress 3s ease-in-out infinite;
             }
-        """),
+        """)
+    )
+)
+
+# Responses smaller than this many bytes aren't worth compressing
+GZIP_MINIMUM_SIZE = 500
+
+# Create the FastHTML app. Tailwind's CDN build generates the styles in the
+# browser, so it stays render-blocking. htmx comes from FastHTML's default
+# headers, on the same CDN as its other scripts, so it isn't added again.
+# surreal.js and its scoped-CSS helper aren't used, so they aren't loaded.
+app, rt = fast_app(
+    hdrs=(
+        Script(src="https://cdn.tailwindcss.com"),
+        Meta(name="viewport", content="width=device-width, initial-scale=1"),
+        _STYLE_HTML,
     ),
+    surreal=False,
+    # Pages are mostly repeated Tailwind class strings and compress well
+    middleware=(Middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE),),
     bodykw={"class": "bg-gray-50"},
+    on_shutdown=[_cancel_prefetch, close_async_connection],
 )
 
 
-def format_scenario_text(text: str) -> list:
+# Paragraphs are separated by a blank line, which may hold stray whitespace
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def format_scenario_text(text: str) -> list[FT]:
     """Convert scenario text to HTML paragraphs."""
-    # Split by double newlines for paragraphs
-    paragraphs = text.strip().split("\n\n")
     return [
-        P(para.strip(), cls="mb-4 text-gray-700 leading-relaxed")
-        for para in paragraphs
-        if para.strip()
+        P(para, cls="mb-4 text-gray-700 leading-relaxed")
+        for para in filter(None, map(str.strip, _PARAGRAPH_BREAK.split(text)))
     ]
 
 
+# The page around the challenge never changes, so it is rendered once and
+# the challenge itself is fetched by htmx as soon as the page loads
+SHELL_HTML = to_xml(
+    Html(
+        Head(Title("Piste Mind - Tactical Epee Training"), *app.hdrs),
+        Body(
+            Div(
+                H1("🤺 Tactical Scenario", cls="text-3xl font-bold text-gray-800 mb-8"),
+                Div(
+                    # Skeleton shown until the challenge is swapped in
+                    Div(
+                        *[
+                            Div(cls=f"h-4 bg-gray-200 rounded mb-4 {width}")
+                            for width in ("w-full", "w-5/6", "w-full", "w-2/3")
+                        ],
+                        cls="bg-white p-8 rounded-xl shadow-lg mb-8 animate-pulse",
+                    ),
+                    id="challenge-root",
+                    hx_get="/challenge-fragment",
+                    hx_trigger="load",
+                    hx_indicator="#loading",
+                ),
+                # Loading indicator
+                Div(
+                    "Loading...",
+                    id="loading",
+                    cls="htmx-indicator fixed top-4 right-4 bg-blue-600 text-white px-4 py-2 rounded-lg shadow-lg",
+                ),
+                # Area for explanation form (will be inserted here)
+                Div(id="explanation-area"),
+                cls="max-w-4xl mx-auto p-6 bg-gray-50 min-h-screen",
+            ),
+            **app.bodykw,
+        ),
+    )
+)
+
+
+# Fixed parts of the fragments, prerendered like the shell
+_CHOICES_HEADING = NotStr(
+    to_xml(H2("Your Choices", cls="text-2xl font-semibold text-gray-800 mb-6"))
+)
+_SUBMITTED_BUTTON = NotStr(
+    to_xml(
+        Button(
+            "✓ Submitted",
+            type="button",
+            disabled=True,
+            cls="w-full mt-4 px-6 py-3 bg-gray-400 text-white font-semibold rounded-lg cursor-not-allowed",
+        )
+    )
+)
+_NEW_SCENARIO_BUTTON = NotStr(
+    to_xml(
+        Div(
+            Button(
+                "Try Another Scenario",
+                onclick="window.location.reload()",
+                cls="px-8 py-3 bg-gray-800 text-white font-semibold rounded-lg hover:bg-gray-900 transition-colors duration-200",
+            ),
+            cls="text-center mt-8",
+        )
+    )
+)
+
+
 @rt("/")
 async def index() -> Any:  # noqa: ANN401
-    """Main page - shows scenario and options."""
-    logger.info("Creating new training session")
+    """Main page - the static shell that loads a challenge into itself."""
+    return HTMLResponse(SHELL_HTML)
 
-    # Create new session
-    session = await session_service.create_session("web", model_type.name.lower())
 
-    # Generate scenario and choices
-    logger.debug("Generating scenario and options for web interface")
-    session = await session_service.generate_scenario_for_session(session.session_id)
+# The lettered circles are the same on every page, so they're prerendered
+_OPTION_CIRCLES = tuple(
+    NotStr(
+        to_xml(
+            Div(
+                Div(
+                    OPTION_LETTERS[i],
+                    cls="option-letter text-lg font-bold text-blue-600",
+                ),
+                cls="option-circle flex items-center justify-center w-10 h-10 rounded-full border-2 border-gray-300 transition-colors duration-200",
+            )
+        )
+    )
+    for i in range(NUM_OPTIONS)
+)
+
+
+def _option_label(i: int, option: str, session_id: str) -> FT:
+    """A selectable option card that posts the choice when picked."""
+    return Label(
+        Input(
+            type="radio",
+            name="option",
+            value=str(i),
+            id=f"option-{i}",
+            cls="peer sr-only",
+            hx_post=f"/select-option/{session_id}",
+            hx_target="#explanation-area",
+            hx_swap="outerHTML",
+            hx_trigger="change",
+            hx_indicator="#loading",
+            hx_include="#explanation-text",
+        ),
+        Div(
+            _OPTION_CIRCLES[i],
+            Div(option, cls="flex-1 text-gray-700"),
+            cls="flex items-start gap-4",
+        ),
+        for_=f"option-{i}",
+        cls="block mb-4 p-5 border-2 border-gray-200 rounded-lg cursor-pointer hover:border-gray-300 hover:bg-gray-50 has-[:checked]:border-blue-500 has-[:checked]:bg-blue-50 transition-colors duration-200",
+    )
 
-    # Edit for readability
-    assert session.scenario is not None, "Scenario should be generated"
-    assert session.choices is not None, "Choices should be generated"
-    challenge = Challenge(scenario=session.scenario, choices=session.choices)
-    edited_challenge = await edit_content(challenge, model)
 
-    return Title("Piste Mind - Tactical Epee Training"), Div(
+@rt("/challenge-fragment")
+async def challenge_fragment(htmx: HtmxHeaders) -> Any:  # noqa: ANN401
+    """Scenario and options of a new session, swapped into the page shell."""
+    if not htmx.request:
+        # Opened directly; the shell renders the fragment in its page
+        return Redirect("/")
+
+    # Generated and edited for readability, usually ahead of time
+    session, edited_challenge = await _next_challenge()
+
+    return (
+        # Scenario Card with proper paragraphs
         Div(
-            H1("🤺 Tactical Scenario", cls="text-3xl font-bold text-gray-800 mb-8"),
-            # Scenario Card with proper paragraphs
-            Div(
-                Div(*format_scenario_text(edited_challenge.scenario.scenario)),
-                cls="bg-white p-8 rounded-xl shadow-lg mb-8",
-            ),
-            # Options
-            H2("Your Choices", cls="text-2xl font-semibold text-gray-800 mb-6"),
-            Div(
-                *[
-                    Label(
-                        Input(
-                            type="radio",
-                            name="option",
-                            value=str(i),
-                            id=f"option-{i}",
-                            cls="peer sr-only",
-                            hx_post=f"/select-option/{session.session_id}",
-                            hx_target="#explanation-area",
-                            hx_swap="outerHTML",
-                            hx_trigger="change",
-                            hx_indicator="#loading",
-                            hx_include="#explanation-text",
-                        ),
-                        Div(
-                            Div(
-                                Div(
-                                    f"{chr(65 + i)}",
-                                    cls="option-letter text-lg font-bold text-blue-600",
-                                ),
-                                cls="option-circle flex items-center justify-center w-10 h-10 rounded-full border-2 border-gray-300 transition-all duration-200",
-                            ),
-                            Div(
-                                edited_challenge.choices.options[i],
-                                cls="flex-1 text-gray-700",
-                            ),
-                            cls="flex items-start gap-4",
-                        ),
-                        for_=f"option-{i}",
-                        cls="block mb-4 p-5 border-2 border-gray-200 rounded-lg cursor-pointer hover:border-gray-300 hover:bg-gray-50 has-[:checked]:border-blue-500 has-[:checked]:bg-blue-50 transition-all duration-200",
-                    )
-                    for i in range(len(edited_challenge.choices.options))
-                ],
-                cls="bg-white p-8 rounded-xl shadow-lg mb-8",
-            ),
-            # Loading indicator
-            Div(
-                "Loading...",
-                id="loading",
-                cls="htmx-indicator fixed top-4 right-4 bg-blue-600 text-white px-4 py-2 rounded-lg shadow-lg",
-            ),
-            # Area for explanation form (will be inserted here)
-            Div(id="explanation-area"),
-            cls="max-w-4xl mx-auto p-6 bg-gray-50 min-h-screen",
-        )
+            Div(*format_scenario_text(edited_challenge.scenario.scenario)),
+            cls="bg-white p-8 rounded-xl shadow-lg mb-8",
+        ),
+        # Options
+        _CHOICES_HEADING,
+        Div(
+            *[
+                _option_label(i, option, session.session_id)
+                for i, option in enumerate(edited_challenge.choices.options)
+            ],
+            cls="bg-white p-8 rounded-xl shadow-lg mb-8",
+        ),
     )
 
 
@@ -230,13 +406,13 @@ async def select_option(session_id: str, option: str, explanation: str = "") ->
                     "Submit",
                     type="submit",
                     cls="w-full mt-4 px-6 py-3 bg-blue-600 text-white font-semibold rounded-lg hover:bg-blue-700 transition-colors duration-200 disabled:bg-gray-400 disabled:cursor-not-allowed",
-                    hx_disabled_elt="this",
-                    onclick="this.disabled = true; this.form.requestSubmit();",
                 ),
                 hx_post=f"/submit-explanation/{session_id}",
                 hx_target="#explanation-area",
                 hx_swap="outerHTML",
                 hx_trigger="submit",
+                # htmx disables the button while the form's request runs
+                hx_disabled_elt="find button",
             ),
             cls="bg-white p-8 rounded-xl shadow-lg animate-slide-down",
         ),
@@ -245,23 +421,108 @@ async def select_option(session_id: str, option: str, explanation: str = "") ->
     )
 
 
+# Feedback edits running in the background, served by /edited-feedback.
+# Finished edits stay for revisits, so only the newest are kept; running
+# ones are never evicted, since a request may be waiting on them.
+FEEDBACK_EDITS_LIMIT = 256
+# Seconds the browser may reuse an edited-feedback response
+EDITED_FEEDBACK_MAX_AGE = 300
+_feedback_edits: dict[str, asyncio.Task[Feedback]] = {}
+
+
+def _start_feedback_edit(session_id: str, feedback: Feedback) -> None:
+    """Edit feedback in the background, dropping the oldest finished edits."""
+    _feedback_edits[session_id] = asyncio.create_task(edit_content(feedback, model))
+    excess = len(_feedback_edits) - FEEDBACK_EDITS_LIMIT
+    if excess > 0:
+        finished = [key for key, task in _feedback_edits.items() if task.done()]
+        for key in finished[:excess]:
+            del _feedback_edits[key]
+
+
+# Feedback fields in reading order, with their prerendered card headings and
+# the class of their text; the longer sections keep the model's line breaks
+_FEEDBACK_CARDS = tuple(
+    (
+        field,
+        NotStr(to_xml(H3(title, cls=f"text-xl font-semibold {color} mb-3"))),
+        f"text-gray-700 leading-relaxed{extra}",
+    )
+    for field, title, color, extra in (
+        ("acknowledgment", "✓ Acknowledgment", "text-green-700", ""),
+        ("analysis", "📊 Tactical Analysis", "text-blue-700", " whitespace-pre-wrap"),
+        (
+            "advanced_concepts",
+            "🎯 Advanced Concepts",
+            "text-purple-700",
+            " whitespace-pre-wrap",
+        ),
+        (
+            "bridge_to_mastery",
+            "🏆 Bridge to Mastery",
+            "text-amber-700",
+            " whitespace-pre-wrap",
+        ),
+    )
+)
+
+
+def _feedback_cards(feedback: Feedback, **attrs: str) -> FT:
+    """The four feedback sections as cards, in one swappable container."""
+    return Div(
+        *[
+            Div(
+                heading,
+                P(getattr(feedback, field), cls=text_cls),
+                cls="bg-white p-6 rounded-xl shadow-lg mb-6",
+            )
+            for field, heading, text_cls in _FEEDBACK_CARDS
+        ],
+        id="feedback-cards",
+        **attrs,
+    )
+
+
+@rt("/edited-feedback/{session_id}")
+async def edited_feedback(session_id: str, htmx: HtmxHeaders) -> Any:  # noqa: ANN401
+    """Feedback cards with the edited text, once the background edit is done.
+
+    The finished task stays in _feedback_edits, so revisiting the page gets
+    the same edit; the browser may also reuse the response for a while.
+    """
+    if not htmx.request:
+        return Redirect("/")
+
+    task = _feedback_edits.get(session_id)
+    if task is None:
+        # Nothing to swap in; htmx leaves the unedited cards in place
+        return Response(status_code=204)
+    try:
+        # Shielded so a client that disconnects doesn't cancel the shared edit
+        edited = await asyncio.shield(task)
+    except Exception as e:
+        logger.warning(f"Editing feedback for session {session_id} failed: {e}")
+        return Response(status_code=204)
+    return _feedback_cards(edited), HttpHeader(
+        "Cache-Control", f"private, max-age={EDITED_FEEDBACK_MAX_AGE}"
+    )
+
+
 @rt("/submit-explanation/{session_id}", methods=["POST"])
 async def submit_explanation(session_id: str, explanation: str) -> Any:  # noqa: ANN401
     """Handle explanation submission and show feedback."""
-    # Record the explanation
-    await session_service.record_explanation(session_id, explanation)
-
-    # Generate feedback
-    session = await session_service.generate_feedback_for_session(session_id)
+    # Record the explanation, generate feedback and complete, in one write
+    session = await session_service.explain_and_complete(session_id, explanation)
 
-    # Complete the session
-    await session_service.complete_session(session_id)
-
-    # Edit feedback for readability
     assert session.feedback is not None, "Feedback should be generated"
     assert session.user_answer is not None, "User answer should exist"
     assert session.choices is not None, "Choices should exist"
-    edited_feedback = await edit_content(session.feedback, model)
+
+    # The next challenge can be prepared while the user reads the feedback
+    _schedule_prefetch()
+
+    # Edit for readability in the background; the page polls for the result
+    _start_feedback_edit(session_id, session.feedback)
 
     # Return the full feedback display
     return Div(
@@ -273,12 +534,7 @@ async def submit_explanation(session_id: str, explanation: str) -> Any:  # noqa:
                     cls="text-lg font-semibold text-gray-700",
                 ),
                 P(session.user_answer.explanation, cls="mt-2 text-gray-600 italic"),
-                Button(
-                    "✓ Submitted",
-                    type="button",
-                    disabled=True,
-                    cls="w-full mt-4 px-6 py-3 bg-gray-400 text-white font-semibold rounded-lg cursor-not-allowed",
-                ),
+                _SUBMITTED_BUTTON,
             ),
             cls="bg-white p-8 rounded-xl shadow-lg mb-6",
         ),
@@ -287,7 +543,7 @@ async def submit_explanation(session_id: str, explanation: str) -> Any:  # noqa:
             # Recommendation
             Div(
                 H3(
-                    f"Coach's Recommendation: {chr(65 + session.choices.recommend)}",
+                    f"Coach's Recommendation: {OPTION_LETTERS[session.choices.recommend]}",
                     cls="text-lg font-semibold text-green-800 mb-2",
                 ),
                 P(
@@ -296,54 +552,15 @@ async def submit_explanation(session_id: str, explanation: str) -> Any:  # noqa:
                 ),
                 cls="bg-green-50 border-2 border-green-200 p-6 rounded-lg mb-6",
             ),
-            # Feedback cards
-            Div(
-                H3("✓ Acknowledgment", cls="text-xl font-semibold text-green-700 mb-3"),
-                P(edited_feedback.acknowledgment, cls="text-gray-700 leading-relaxed"),
-                cls="bg-white p-6 rounded-xl shadow-lg mb-6",
-            ),
-            Div(
-                H3(
-                    "📊 Tactical Analysis",
-                    cls="text-xl font-semibold text-blue-700 mb-3",
-                ),
-                P(
-                    edited_feedback.analysis,
-                    cls="text-gray-700 leading-relaxed whitespace-pre-wrap",
-                ),
-                cls="bg-white p-6 rounded-xl shadow-lg mb-6",
-            ),
-            Div(
-                H3(
-                    "🎯 Advanced Concepts",
-                    cls="text-xl font-semibold text-purple-700 mb-3",
-                ),
-                P(
-                    edited_feedback.advanced_concepts,
-                    cls="text-gray-700 leading-relaxed whitespace-pre-wrap",
-                ),
-                cls="bg-white p-6 rounded-xl shadow-lg mb-6",
-            ),
-            Div(
-                H3(
-                    "🏆 Bridge to Mastery",
-                    cls="text-xl font-semibold text-amber-700 mb-3",
-                ),
-                P(
-                    edited_feedback.bridge_to_mastery,
-                    cls="text-gray-700 leading-relaxed whitespace-pre-wrap",
-                ),
-                cls="bg-white p-6 rounded-xl shadow-lg mb-6",
+            # Unedited feedback first; the edited version replaces it on arrival
+            _feedback_cards(
+                session.feedback,
+                hx_get=f"/edited-feedback/{session_id}",
+                hx_trigger="load",
+                hx_swap="outerHTML",
             ),
             # New scenario button
-            Div(
-                Button(
-                    "Try Another Scenario",
-                    onclick="window.location.reload()",
-                    cls="px-8 py-3 bg-gray-800 text-white font-semibold rounded-lg hover:bg-gray-900 transition-colors duration-200",
-                ),
-                cls="text-center mt-8",
-            ),
+            _NEW_SCENARIO_BUTTON,
             cls="animate-fade-in",
         ),
         id="explanation-area",
@@ -355,6 +572,10 @@ if __name__ == "__main__":
     import uvicorn
 
     logger.debug("Setting up logging for web interface")
+    # Write log records from a background thread so request handlers never
+    # block on stderr
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "DEBUG"), enqueue=True)
     logger.info("Starting Piste Mind web interface...")
 
     logger.debug("Getting port from environment or using default")
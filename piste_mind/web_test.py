@@ -0,0 +1,157 @@
+"""Tests for the web app's background prefetching and feedback edits."""
+
+import asyncio
+from collections import Counter
+from collections.abc import Generator
+from datetime import UTC, datetime
+
+import pytest
+from fasthtml.common import HtmxHeaders
+
+from piste_mind import web
+from piste_mind.db.models import SessionState
+from piste_mind.db.repository import SessionRepository
+from piste_mind.fixtures import challenge_fixture, feedback_fixture
+from piste_mind.models import Challenge, Feedback, Scenario
+
+
+def _edited(challenge: Challenge) -> Challenge:
+    """A recognisably different challenge standing in for the edited one."""
+    return challenge.model_copy(
+        update={"scenario": Scenario.model_construct(scenario="Edited scenario.")}
+    )
+
+
+@pytest.fixture(autouse=True)
+def _empty_prefetch_queue(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Start each test with nothing queued and no prefetches scheduled."""
+    monkeypatch.setattr(web, "_prefetched", asyncio.Queue(web.PREFETCH_DEPTH))
+    monkeypatch.setattr(web, "_schedule_prefetch", lambda: None)
+    monkeypatch.setattr(web, "_prefetch_stats", Counter())
+    yield
+
+
+async def test_prefetch_queues_challenge_without_creating_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A prefetched challenge waits in the queue with no session behind it."""
+    challenge = challenge_fixture()
+
+    async def prepare_challenge():
+        return challenge
+
+    async def edit_content(content, model):
+        return _edited(content)
+
+    async def create_session(session):
+        raise AssertionError("prefetching must not insert a session")
+
+    monkeypatch.setattr(web.session_service, "prepare_challenge", prepare_challenge)
+    monkeypatch.setattr(web, "edit_content", edit_content)
+    monkeypatch.setattr(
+        web.session_service.repository, "create_session", create_session
+    )
+
+    await web._prefetch_challenge()
+
+    assert web._prefetched.get_nowait() == (challenge, _edited(challenge))
+
+
+async def test_prefetch_failure_queues_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed prefetch is dropped; the next page load generates its own."""
+
+    async def prepare_challenge():
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(web.session_service, "prepare_challenge", prepare_challenge)
+
+    await web._prefetch_challenge()
+
+    assert web._prefetched.empty()
+
+
+async def test_next_challenge_inserts_prefetched_session_when_served() -> None:
+    """A queued challenge gets its session, and its timers, when served."""
+    challenge = challenge_fixture()
+    web._prefetched.put_nowait((challenge, _edited(challenge)))
+    served_after = datetime.now(UTC)
+
+    session, edited = await web._next_challenge()
+
+    assert edited == _edited(challenge)
+    assert web._prefetch_stats == {"hit": 1}
+    stored = await SessionRepository().get_session(session.session_id)
+    assert stored is not None
+    assert stored.state == SessionState.SCENARIO_GENERATED
+    # The unedited challenge is what the session records
+    assert stored.scenario == challenge.scenario
+    assert stored.choices == challenge.choices
+    assert stored.updated_at >= served_after
+
+
+async def test_next_challenge_prepares_inline_when_queue_is_empty(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With nothing queued the page load prepares a challenge itself."""
+    prepared = object()
+
+    async def prepare_challenge():
+        return prepared
+
+    monkeypatch.setattr(web, "_prepare_challenge", prepare_challenge)
+
+    assert await web._next_challenge() is prepared
+    assert web._prefetch_stats == {"miss": 1}
+
+
+@pytest.fixture
+def edits_released(monkeypatch: pytest.MonkeyPatch) -> asyncio.Event:
+    """Hold every feedback edit until the returned event is set."""
+    released = asyncio.Event()
+
+    async def edit_content(content, model):
+        await released.wait()
+        return content
+
+    monkeypatch.setattr(web, "edit_content", edit_content)
+    monkeypatch.setattr(web, "_feedback_edits", {})
+    monkeypatch.setattr(web, "FEEDBACK_EDITS_LIMIT", 2)
+    return released
+
+
+async def test_running_feedback_edits_are_never_evicted(
+    edits_released: asyncio.Event,
+) -> None:
+    """Past the limit only finished edits are dropped, oldest first."""
+    for session_id in ("first", "second", "third"):
+        web._start_feedback_edit(session_id, feedback_fixture())
+    running = dict(web._feedback_edits)
+    assert list(running) == ["first", "second", "third"]
+
+    edits_released.set()
+    await asyncio.gather(*running.values())
+    web._start_feedback_edit("fourth", feedback_fixture())
+
+    assert list(web._feedback_edits) == ["third", "fourth"]
+    assert not any(task.cancelled() for task in running.values())
+
+
+async def test_disconnected_request_leaves_the_edit_running(
+    edits_released: asyncio.Event,
+) -> None:
+    """A request cancelled while waiting doesn't cancel the shared edit."""
+    web._start_feedback_edit("session", feedback_fixture())
+    htmx = HtmxHeaders(request="true")
+    waiting = asyncio.create_task(web.edited_feedback("session", htmx))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    edits_released.set()
+    cards, _ = await web.edited_feedback("session", htmx)
+
+    assert cards.id == "feedback-cards"
+    assert isinstance(await web._feedback_edits["session"], Feedback)